@@ -42,6 +42,7 @@ from ..utils import (
     configure_ocr_environment,
     configure_ocr_warnings,
     discover_files,
+    filter_by_extension,
     generate_file_tree,
     get_directory_cache,
     get_output_file_path,
@@ -52,16 +53,36 @@ from ..utils import (
 )
 
 
+def _file_size(file_path: str) -> int:
+    try:
+        return os.stat(file_path).st_size
+    except OSError:
+        return 0
+
+
 def _apply_threads_env(threads: int | None) -> None:
     if threads and threads > 0:
         os.environ["OMP_NUM_THREADS"] = str(threads)
         os.environ["MKL_NUM_THREADS"] = str(threads)
 
 
+# Flags for writing converted Markdown with raw os.write calls (O_BINARY exists on Windows only)
+_OUTPUT_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
 def _save_output_file(output_file_path: str, content: str, dir_cache) -> None:
     dir_cache.ensure_directory(os.path.dirname(output_file_path))
-    with open(output_file_path, "w", encoding="utf-8") as f:
-        f.write(content)
+    # Encode once and write the bytes directly, skipping the text-mode wrapper.
+    # Line endings stay platform-native, as with the previous text-mode write.
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(output_file_path, _OUTPUT_OPEN_FLAGS, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
 
 
 def _determine_output_directory(args, base_dir: str) -> str:
@@ -191,8 +212,16 @@ def validate_arguments(args):
     return validate_common_arguments(args)
 
 
-def main():
-    """Main entry point for ocr-convert command."""
+def main(argv: list[str] | None = None) -> int:
+    """
+    Main entry point for ocr-convert command.
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code (0 on success, 1 if any file failed)
+    """
     # Configure OCR-related environment before any heavy imports
     configure_ocr_environment()
     configure_ocr_warnings()
@@ -210,22 +239,35 @@ def main():
     )
 
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Handle --list-formats
     if args.list_formats:
         list_supported_formats()
-        return
+        return 0
 
     # Validate arguments
     if not validate_arguments(args):
         parser.print_help()
-        sys.exit(1)
+        return 1
 
     # Configure logging
     setup_logging()
     configure_logging_level(args)
 
+    return _run(args)
+
+
+def _run(args: Namespace) -> int:
+    """
+    Run a conversion for already parsed and validated arguments.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Process exit code (0 on success, 1 if any file failed)
+    """
     try:
         _apply_threads_env(getattr(args, "threads", None))
 
@@ -234,17 +276,21 @@ def main():
 
         # Validate input path
         if not check_input_path_exists(args):
-            sys.exit(1)
+            return 1
 
         # Discover files to process
         recursive = not args.no_recursive
+        ignore_dirs = config.DEFAULT_IGNORED_DIRS.union(getattr(args, "ignore_dir", None) or ())
         files_to_process, base_dir, file_relative_paths = discover_files(
-            args.input_path, recursive=recursive
+            args.input_path,
+            recursive=recursive,
+            parallel=getattr(args, "parallel_discovery", False),
+            ignore_dirs=ignore_dirs,
         )
 
         if not files_to_process:
             logging.info("No supported files found to process.")
-            sys.exit(0)
+            return 0
 
         # Display initial information
         search_type = "recursively" if recursive else "non-recursively"
@@ -264,14 +310,10 @@ def main():
 
         # Lazily load OCR model only if any file requires it.
         ocr_required_exts = config.get_ocr_supported_formats()
-        needs_ocr_model = any(
-            Path(p).suffix.lower() in ocr_required_exts for p in files_to_process
-        )
+        needs_ocr_model = bool(filter_by_extension(files_to_process, ocr_required_exts))
 
         ocr_parallel_exts = config.SUPPORTED_PDF_FORMATS | config.SUPPORTED_IMAGE_FORMATS
-        ocr_pool_candidates = [
-            p for p in files_to_process if Path(p).suffix.lower() in ocr_parallel_exts
-        ]
+        ocr_pool_candidates = filter_by_extension(files_to_process, ocr_parallel_exts)
 
         ocr_workers = 1
         ocr_workers_reason = "single-process OCR pipeline"
@@ -332,10 +374,12 @@ def main():
 
         # Only parallelize formats that never touch GPU/COM conversion in our pipeline.
         parallel_safe_exts = {".txt", ".md", ".rtf", ".xlsx"}
-        parallel_file_set = {
-            p for p in files_to_process if Path(p).suffix.lower() in parallel_safe_exts
-        }
+        parallel_file_set = set(filter_by_extension(files_to_process, parallel_safe_exts))
         parallel_files = [p for p in files_to_process if p in parallel_file_set]
+        # Submit the largest files first so a big file does not start last and leave
+        # the other workers idle; only pooled batches of several files need the sizes.
+        if args.workers > 1 and len(parallel_files) > 1:
+            parallel_files.sort(key=_file_size, reverse=True)
         ocr_pool_files = []
         serial_files = [p for p in files_to_process if p not in parallel_file_set]
 
@@ -351,6 +395,11 @@ def main():
         if ocr_pool_candidates:
             write_executor = ThreadPoolExecutor(max_workers=ocr_io_workers)
 
+        # Light-path processors are stateless, so one instance serves the whole batch
+        # (including the text/Excel worker threads).
+        text_processor = TextFileProcessor()
+        excel_processor = ExcelDataProcessor()
+
         def _get_output_paths(file_path: str) -> tuple[str, str, str]:
             relative_path = file_relative_paths.get(file_path, os.path.basename(file_path))
             output_file_path = get_output_file_path(
@@ -388,8 +437,6 @@ def main():
                 else:
                     # Light path: handle text / xlsx without loading OCR model.
                     start_time = time.time()
-                    text_processor = TextFileProcessor()
-                    excel_processor = ExcelDataProcessor()
 
                     if ext in {".txt", ".md", ".rtf"}:
                         content = text_processor.process_file(file_path)
@@ -672,20 +719,19 @@ def main():
         print(f"\nConversion completed! Files saved to: {output_directory}{structure_note}")
 
         # Exit with error code if any files failed
-        if failed > 0:
-            sys.exit(1)
+        return 1 if failed > 0 else 0
 
     except KeyboardInterrupt:
         logging.info("Conversion cancelled by user.")
-        sys.exit(1)
+        return 1
     except Exception as e:
         logging.error(f"Unexpected error: {e}")
         if args.verbose:
             import traceback
 
             traceback.print_exc()
-        sys.exit(1)
+        return 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -5,6 +5,8 @@ This module contains default configuration values used across the OCR toolkit,
 including processing parameters, output directories, and supported file formats.
 """
 
+from functools import cache
+
 # Default processing parameters
 DEFAULT_BATCH_SIZE = 1
 """int: Default batch size for processing pages.
@@ -47,6 +49,9 @@ DEFAULT_MARKDOWN_OUTPUT_DIR = "markdown_output"
 DEFAULT_OCR_OUTPUT_DIR = "output_ocr"
 """str: Default subdirectory name for OCR-processed PDF files."""
 
+DEFAULT_IGNORED_DIRS = frozenset({".git", ".hg", ".svn", "__pycache__", "node_modules", ".venv"})
+"""FrozenSet[str]: Directory names never descended into during recursive file discovery."""
+
 # Supported file formats (centralized)
 SUPPORTED_PDF_FORMATS = {".pdf"}
 """Set[str]: PDF file formats supported by the toolkit."""
@@ -70,14 +75,17 @@ SUPPORTED_EBOOK_FORMATS = {".epub"}
 """Set[str]: E-book formats supported by MarkItDown."""
 
 
-def get_all_supported_formats() -> set[str]:
+@cache
+def get_all_supported_formats() -> frozenset[str]:
     """
     Get the complete set of all supported file formats.
 
+    The union is built once and cached; the format sets above are constants.
+
     Returns:
-        Set of all supported file extensions
+        Frozen set of all supported file extensions
     """
-    return (
+    return frozenset(
         SUPPORTED_PDF_FORMATS
         | SUPPORTED_IMAGE_FORMATS
         | SUPPORTED_OFFICE_FORMATS
@@ -88,11 +96,14 @@ def get_all_supported_formats() -> set[str]:
     )
 
 
-def get_ocr_supported_formats() -> set[str]:
+@cache
+def get_ocr_supported_formats() -> frozenset[str]:
     """
     Get file formats that can be processed by OCR.
 
+    Cached like get_all_supported_formats, since it is checked once per file.
+
     Returns:
-        Set of OCR-supported file extensions
+        Frozen set of OCR-supported file extensions
     """
-    return SUPPORTED_PDF_FORMATS | SUPPORTED_IMAGE_FORMATS | SUPPORTED_OFFICE_FORMATS
+    return frozenset(SUPPORTED_PDF_FORMATS | SUPPORTED_IMAGE_FORMATS | SUPPORTED_OFFICE_FORMATS)
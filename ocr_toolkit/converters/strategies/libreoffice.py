@@ -26,7 +26,7 @@ class LibreOfficeStrategy(ConversionStrategy):
     Requires the `soffice` binary (LibreOffice) to be installed and available in PATH.
     """
 
-    SUPPORTED_FORMATS = {".doc", ".docx", ".ppt", ".pptx", ".xls", ".xlsx"}
+    SUPPORTED_FORMATS = frozenset({".doc", ".docx", ".ppt", ".pptx", ".xls", ".xlsx"})
 
     def __init__(self, timeout_seconds: int = 180):
         self.timeout_seconds = timeout_seconds
@@ -7,10 +7,10 @@ to ensure consistent interfaces and error handling across the toolkit.
 
 import logging
 import os
+import stat
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Any
 
 
@@ -167,12 +167,14 @@ class FileProcessorBase(ABC):
         if not file_path:
             return False
 
-        path = Path(file_path)
-        if not path.exists():
+        # One stat answers both "exists" and "is a regular file"
+        try:
+            st = os.stat(file_path)
+        except (OSError, ValueError):
             self.logger.error(f"File does not exist: {file_path}")
             return False
 
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             self.logger.error(f"Path is not a file: {file_path}")
             return False
 
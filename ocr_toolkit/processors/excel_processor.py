@@ -24,7 +24,7 @@ class ExcelDataProcessor(FileProcessorBase):
     - Proper handling of formulas, dates, and cell values
     """
 
-    SUPPORTED_FORMATS = {".xlsx", ".xls"}
+    SUPPORTED_FORMATS = frozenset({".xlsx", ".xls"})
 
     def __init__(self):
         """Initialize Excel data processor."""
@@ -94,16 +94,12 @@ class ExcelDataProcessor(FileProcessorBase):
                 result.processing_time = time.time() - start_time
                 return result
 
-            # Process the Excel file
-            content = self._process_excel_file(file_path, openpyxl)
+            # Process the Excel file; sheets count as "pages"
+            content, sheet_count = self._process_excel_file(file_path, openpyxl)
             result.content = content
+            result.pages = sheet_count
             result.success = True
 
-            # Count sheets as "pages"
-            wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
-            result.pages = len(wb.sheetnames)
-            wb.close()
-
             self.logger.debug(f"Extracted data from {result.pages} sheets in {file_path}")
 
         except Exception as e:
@@ -112,16 +108,19 @@ class ExcelDataProcessor(FileProcessorBase):
         result.processing_time = time.time() - start_time
         return result
 
-    def _process_excel_file(self, file_path: str, openpyxl) -> str:
+    def _process_excel_file(self, file_path: str, openpyxl) -> tuple[str, int]:
         """
         Process Excel file and extract data as Markdown.
 
+        The workbook is opened once; its sheet count is returned alongside the
+        content so callers do not need to load it a second time.
+
         Args:
             file_path: Path to the Excel file
             openpyxl: openpyxl module reference
 
         Returns:
-            Markdown formatted content with all sheets
+            Tuple of (Markdown formatted content with all sheets, number of sheets)
         """
         try:
             # Load workbook in read-only mode for better performance
@@ -139,8 +138,10 @@ class ExcelDataProcessor(FileProcessorBase):
         markdown_parts = [f"# {Path(file_path).name}"]
 
         try:
+            sheet_names = wb.sheetnames
+
             # Process each sheet
-            for sheet_name in wb.sheetnames:
+            for sheet_name in sheet_names:
                 try:
                     ws = wb[sheet_name]
                     sheet_md = self._sheet_to_markdown(ws, sheet_name)
@@ -154,7 +155,7 @@ class ExcelDataProcessor(FileProcessorBase):
         finally:
             wb.close()
 
-        return "\n\n".join(markdown_parts)
+        return "\n\n".join(markdown_parts), len(sheet_names)
 
     def _sheet_to_markdown(self, ws, sheet_name: str) -> str:
         """
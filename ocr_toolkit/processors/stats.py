@@ -5,7 +5,10 @@ This module provides a dedicated class for tracking processing statistics,
 separating this concern from the main processing logic.
 """
 
+from collections import Counter
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 
 
@@ -23,7 +26,13 @@ class ProcessingStats:
     failed_processed: int = 0
     total_processing_time: float = 0.0
     total_pages: int = 0
-    method_stats: dict[str, int] = field(default_factory=dict)
+    _method_stats: Counter[str] = field(default_factory=Counter, init=False)
+    _summary: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def method_stats(self) -> Mapping[str, int]:
+        """Read-only view of the number of results per processing method."""
+        return MappingProxyType(self._method_stats)
 
     def add_result(self, method: str, success: bool, processing_time: float = 0.0, pages: int = 0):
         """
@@ -45,18 +54,59 @@ class ProcessingStats:
             self.failed_processed += 1
 
         # Track method-specific statistics
-        if method in self.method_stats:
-            self.method_stats[method] += 1
-        else:
-            self.method_stats[method] = 1
+        self._method_stats[method] += 1
+
+        self._summary = None
+
+    def add_results(self, records: Iterable[tuple[str, bool, float, int]]):
+        """
+        Add several processing results to the statistics in one pass.
+
+        Equivalent to calling add_result() for each record in order, but the
+        totals are accumulated locally and written back once, so a malformed
+        record or a failing iterable leaves the statistics unchanged.
+
+        Args:
+            records: (method, success, processing_time, pages) tuples
+        """
+        processed = successful = pages_total = 0
+        total_time = self.total_processing_time
+        method_stats = Counter()
+
+        for method, success, processing_time, pages in records:
+            processed += 1
+            total_time += processing_time
+            pages_total += pages
+            if success:
+                successful += 1
+            method_stats[method] += 1
+
+        self._method_stats.update(method_stats)
+        self.total_processed += processed
+        self.successful_processed += successful
+        self.failed_processed += processed - successful
+        self.total_processing_time = total_time
+        self.total_pages += pages_total
+        self._summary = None
 
     def get_summary(self) -> dict[str, Any]:
         """
         Get a comprehensive summary of processing statistics.
 
+        The figures are cached until add_result(), add_results() or reset() next
+        changes the statistics; each call returns a fresh copy, so callers may modify it.
+
         Returns:
             Dictionary with calculated statistics and percentages
         """
+        if self._summary is None:
+            self._summary = self._build_summary()
+        summary = self._summary.copy()
+        summary["method_stats"] = summary["method_stats"].copy()
+        return summary
+
+    def _build_summary(self) -> dict[str, Any]:
+        """Compute the summary returned by get_summary()."""
         if self.total_processed == 0:
             return {
                 "total_processed": 0,
@@ -81,7 +131,7 @@ class ProcessingStats:
             "average_time_per_file": self.total_processing_time / self.total_processed,
             "average_time_per_page": average_time_per_page,
             "total_processing_time": self.total_processing_time,
-            "method_stats": self.method_stats.copy(),
+            "method_stats": self._method_stats.copy(),
         }
 
     def reset(self):
@@ -91,4 +141,5 @@ class ProcessingStats:
         self.failed_processed = 0
         self.total_processing_time = 0.0
         self.total_pages = 0
-        self.method_stats.clear()
+        self._method_stats.clear()
+        self._summary = None
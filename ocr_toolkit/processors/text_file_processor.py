@@ -23,7 +23,7 @@ class TextFileProcessor:
     """
 
     # Supported text file formats
-    SUPPORTED_FORMATS = {".txt", ".md", ".rtf"}
+    SUPPORTED_FORMATS = frozenset({".txt", ".md", ".rtf"})
 
     def __init__(self):
         """Initialize text file processor."""
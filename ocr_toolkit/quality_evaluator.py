@@ -12,6 +12,23 @@ from typing import Any
 
 from . import config
 
+# Characters that count as "special": not a word character, whitespace or common punctuation
+_SPECIAL_CHAR_RE = re.compile(r'[^\w\s.,!?;:()\[\]{}"-]')
+# str.translate table deleting every ASCII character _SPECIAL_CHAR_RE does not match
+_ASCII_NON_SPECIAL = dict.fromkeys(c for c in range(128) if not _SPECIAL_CHAR_RE.match(chr(c)))
+_WORD_RE = re.compile(r"\w+")
+
+
+def _count_special_chars(text: str) -> int:
+    """
+    Count the characters in text matched by _SPECIAL_CHAR_RE.
+
+    Ordinary ASCII characters are deleted with str.translate first, so the regex
+    only has to classify what is left, and pure-ASCII leftovers need no regex at all.
+    """
+    rest = text.translate(_ASCII_NON_SPECIAL)
+    return len(rest) if rest.isascii() else len(_SPECIAL_CHAR_RE.findall(rest))
+
 
 class QualityEvaluator:
     """Evaluates and compares the quality of document processing results."""
@@ -101,12 +118,12 @@ class QualityEvaluator:
             error_penalty *= 0.8
 
         # Detect excessive special characters
-        special_char_ratio = len(re.findall(r'[^\w\s\n.,!?;:()\[\]{}""' "-]", text)) / len(text)
+        special_char_ratio = _count_special_chars(text) / len(text)
         if special_char_ratio > config.QUALITY_SPECIAL_CHAR_THRESHOLD:
             error_penalty *= 0.9
 
         # Detect very short "words" (potential OCR artifacts)
-        words = re.findall(r"\b\w+\b", text)
+        words = _WORD_RE.findall(text)
         if words:
             very_short_words = len([w for w in words if len(w) == 1])
             short_word_ratio = very_short_words / len(words)
@@ -18,6 +18,7 @@ from .cli_common import (
 from .file_discovery import (
     discover_files,
     discover_pdf_files,
+    filter_by_extension,
     get_directory_cache,
     get_output_file_path,
     get_supported_extensions,
@@ -48,6 +49,7 @@ def get_device_info():
 __all__ = [
     "discover_files",
     "discover_pdf_files",
+    "filter_by_extension",
     "get_output_file_path",
     "is_supported_file",
     "get_supported_extensions",
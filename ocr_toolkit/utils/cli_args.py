@@ -67,6 +67,19 @@ def add_output_args(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
         action="store_true",
         help="Disable recursive search in directories (process only top-level files)",
     )
+    parser.add_argument(
+        "--parallel-discovery",
+        action="store_true",
+        help="List directories concurrently during recursive search (large or network trees)",
+    )
+    parser.add_argument(
+        "--ignore-dir",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="Directory name to skip during recursive search, in addition to "
+        f"{', '.join(sorted(config.DEFAULT_IGNORED_DIRS))} (repeatable)",
+    )
     parser.add_argument(
         "--with-images",
         action="store_true",
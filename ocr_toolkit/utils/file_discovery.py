@@ -7,38 +7,127 @@ that can be processed by the OCR toolkit.
 
 import logging
 import os
-from pathlib import Path
+import stat
+import threading
+from collections.abc import Callable, Collection, Iterable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from pathlib import PurePath
 
 from .. import config
 
+# Supported extensions, computed once; the format lists in config are static.
+_SUPPORTED_EXTS: frozenset[str] = config.get_all_supported_formats()
+
+# Upper bound on threads listing directories in parallel discovery
+_MAX_DISCOVERY_WORKERS = 32
+
+
+def _file_extension(name: str) -> str:
+    """
+    Return the lower-cased extension of a file name (same result as os.path.splitext).
+
+    Args:
+        name: File name without directory components
+
+    Returns:
+        Extension including the dot, or an empty string (also for dotfiles like ".pdf")
+    """
+    dot = name.rfind(".")
+    if dot <= 0:
+        return ""
+    # Only names starting with a dot can have an all-dot head; skip the check otherwise
+    if name[0] == "." and not name[:dot].strip("."):
+        return ""
+    return name[dot:].lower()
+
+
+def _extension_matcher(extensions: Collection[str]) -> Callable[[str], bool]:
+    """
+    Build a predicate telling whether a file name has one of the given extensions.
+
+    The check is a single str.endswith over a tuple of suffixes, done in C, instead of
+    extracting the extension and hashing it. Names starting with a dot fall back to
+    _file_extension so dotfiles such as ".pdf" are rejected, as with os.path.splitext.
+
+    Args:
+        extensions: Lower-case extensions including the dot
+
+    Returns:
+        Function taking a file name and returning True if its extension matches
+    """
+    suffixes = tuple(extensions)
+
+    def matches(name: str) -> bool:
+        return name.lower().endswith(suffixes) and (name[0] != "." or bool(_file_extension(name)))
+
+    return matches
+
+
+def _relative_path_start(base_dir: str) -> int:
+    """
+    Return the index where paths of entries listed under base_dir become relative.
+
+    Walk paths are built by os.scandir joining onto base_dir, so slicing them at this
+    index gives the same result as os.path.relpath without its normalization work.
+
+    Args:
+        base_dir: Directory the walk started from
+
+    Returns:
+        Length of base_dir including its trailing separator
+    """
+    return len(os.path.join(base_dir, ""))
+
 
 class DirectoryCache:
     """Cache for created directories to avoid redundant os.makedirs calls."""
 
     def __init__(self):
         self._created_dirs = set()
+        self._lock = threading.Lock()
 
     def ensure_directory(self, dir_path: str) -> None:
         """
         Ensure directory exists, using cache to avoid redundant calls.
 
+        Parents of a created directory are cached too, so sibling and ancestor
+        outputs skip the filesystem entirely. Safe to call from worker threads.
+
         Args:
             dir_path: Directory path to create
         """
-        if dir_path in self._created_dirs:
+        if not dir_path or dir_path in self._created_dirs:
             return
 
         try:
-            Path(dir_path).mkdir(parents=True, exist_ok=True)
-            self._created_dirs.add(dir_path)
+            os.makedirs(dir_path, exist_ok=True)
             logging.debug(f"Created/verified directory: {dir_path}")
         except (PermissionError, OSError) as e:
             logging.error(f"Failed to create directory {dir_path}: {e}")
             raise
 
+        with self._lock:
+            self._created_dirs.add(dir_path)
+            self._created_dirs.update(str(parent) for parent in PurePath(dir_path).parents)
+
+    def ensure_directories(self, dir_paths: Iterable[str]) -> None:
+        """
+        Ensure a batch of directories exists, creating each unique path once.
+
+        Paths are processed shortest first, so parents are created (and cached)
+        before their children, which then only need their own leaf created.
+
+        Args:
+            dir_paths: Directory paths to create; duplicates are ignored
+        """
+        for dir_path in sorted(set(dir_paths), key=len):
+            self.ensure_directory(dir_path)
+
     def reset(self) -> None:
         """Reset the cache."""
-        self._created_dirs.clear()
+        with self._lock:
+            self._created_dirs.clear()
 
 
 # Global instance for directory caching
@@ -51,86 +140,239 @@ def get_directory_cache() -> DirectoryCache:
 
 
 def _safe_recursive_search(
-    base_path: Path, supported_extensions: set[str], max_depth: int
+    base_dir: str,
+    supported_extensions: frozenset[str],
+    max_depth: int,
+    file_stats: dict[str, os.stat_result] | None = None,
+    ignore_dirs: Collection[str] = frozenset(),
 ) -> tuple[list[str], dict[str, str]]:
     """
     Safely search for files recursively with depth limit and symlink protection.
 
+    Directories are listed with os.scandir so entry types come from the directory
+    listing itself instead of a separate stat call per entry. The walk keeps an
+    explicit stack of open listings rather than recursing, so deep trees cost no
+    Python call frames and cannot hit the interpreter recursion limit.
+
     Args:
-        base_path: Base directory to search from
+        base_dir: Base directory to search from
         supported_extensions: Set of supported file extensions
         max_depth: Maximum recursion depth
+        file_stats: If given, filled with the stat result of each discovered file
+        ignore_dirs: Directory names that are not descended into
 
     Returns:
         Tuple of (file_list, relative_paths_dict)
     """
     files = []
     file_relative_paths = {}
-    visited_paths = set()  # Track visited paths to prevent infinite loops
+    visited_dirs = set()  # (st_dev, st_ino) of visited directories to prevent infinite loops
+    output_dir_name = config.DEFAULT_MARKDOWN_OUTPUT_DIR.lower()
+    rel_start = _relative_path_start(base_dir)
+    is_supported_name = _extension_matcher(supported_extensions)
 
-    def _search_recursive(current_path: Path, current_depth: int):
+    def _list_directory(current_dir: str, dir_stat: os.stat_result, current_depth: int):
+        """Return the name-sorted entries of a directory, or None if it must be skipped."""
         if current_depth > max_depth:
-            logging.warning(f"Maximum depth {max_depth} reached at {current_path}")
-            return
+            logging.warning(f"Maximum depth {max_depth} reached at {current_dir}")
+            return None
+
+        # Prevent infinite loops from symlinks / bind mounts
+        dir_key = (dir_stat.st_dev, dir_stat.st_ino)
+        if dir_key in visited_dirs:
+            logging.debug(f"Skipping already visited path: {current_dir}")
+            return None
+        visited_dirs.add(dir_key)
 
-        # Prevent infinite loops from symlinks
         try:
-            real_path = current_path.resolve()
-            if real_path in visited_paths:
-                logging.debug(f"Skipping already visited path: {current_path}")
-                return
-            visited_paths.add(real_path)
-        except (OSError, RuntimeError) as e:
-            logging.warning(f"Cannot resolve path {current_path}: {e}")
-            return
+            with os.scandir(current_dir) as it:
+                entries = list(it)
+        except (PermissionError, OSError) as e:
+            logging.warning(f"Cannot access directory {current_dir}: {e}")
+            return None
+
+        # Sort for consistent ordering
+        entries.sort(key=lambda e: e.name)
+        return entries
+
+    try:
+        base_stat = os.stat(base_dir)
+    except OSError as e:
+        logging.warning(f"Cannot access directory {base_dir}: {e}")
+        return files, file_relative_paths
+
+    base_entries = _list_directory(base_dir, base_stat, 0)
+    if base_entries is None:
+        return files, file_relative_paths
+
+    # Each frame is (entry_iterator, depth); a subdirectory is listed as soon as it is
+    # reached, which keeps the depth-first, name-sorted order of a recursive walk.
+    stack = [(iter(base_entries), 0)]
+    while stack:
+        entries, current_depth = stack[-1]
+        entry = next(entries, None)
+        if entry is None:
+            stack.pop()
+            continue
 
         try:
-            # Get directory contents with error handling
+            if entry.is_file():
+                if is_supported_name(entry.name):
+                    file_path = entry.path
+                    if file_stats is not None:
+                        file_stats[file_path] = entry.stat()
+                    files.append(file_path)
+                    # Relative path from base directory: every entry path starts with it
+                    rel_path = file_path[rel_start:]
+                    file_relative_paths[file_path] = rel_path.replace("\\", "/")
+            elif entry.is_dir(follow_symlinks=False):
+                # Descend into subdirectories (skip symlinks for safety)
+                # Skip default output directory to avoid re-processing generated files on
+                # repeated runs (e.g., converting a directory twice should not pick up
+                # the previous `markdown_output/` results).
+                if entry.name.lower() == output_dir_name:
+                    logging.debug(f"Skipping output directory: {entry.path}")
+                    continue
+                if entry.name in ignore_dirs:
+                    logging.debug(f"Skipping ignored directory: {entry.path}")
+                    continue
+                # os.stat rather than entry.stat: on Windows the cached DirEntry stat
+                # reports st_dev and st_ino as 0, which would collide for every directory
+                sub_entries = _list_directory(
+                    entry.path, os.stat(entry.path, follow_symlinks=False), current_depth + 1
+                )
+                if sub_entries is not None:
+                    stack.append((iter(sub_entries), current_depth + 1))
+        except (PermissionError, OSError) as e:
+            logging.warning(f"Cannot access item {entry.path}: {e}")
+
+    return files, file_relative_paths
+
+
+def _scan_directory(
+    dir_path: str,
+    supported_extensions: frozenset[str],
+    file_stats: dict[str, os.stat_result] | None = None,
+    ignore_dirs: Collection[str] = frozenset(),
+) -> tuple[list[str], list[tuple[str, os.stat_result]]]:
+    """
+    List one directory, splitting it into supported files and subdirectories to descend into.
+
+    Args:
+        dir_path: Directory to list
+        supported_extensions: Set of supported file extensions
+        file_stats: If given, filled with the stat result of each supported file
+        ignore_dirs: Directory names left out of the returned subdirectories
+
+    Returns:
+        Tuple of (supported_file_paths, [(subdir_path, subdir_stat), ...])
+    """
+    files = []
+    subdirs = []
+    is_supported_name = _extension_matcher(supported_extensions)
+    with os.scandir(dir_path) as it:
+        for entry in it:
             try:
-                dir_items = list(current_path.iterdir())
+                if entry.is_file():
+                    if is_supported_name(entry.name):
+                        if file_stats is not None:
+                            file_stats[entry.path] = entry.stat()
+                        files.append(entry.path)
+                elif entry.is_dir(follow_symlinks=False):
+                    if entry.name.lower() == config.DEFAULT_MARKDOWN_OUTPUT_DIR.lower():
+                        logging.debug(f"Skipping output directory: {entry.path}")
+                        continue
+                    if entry.name in ignore_dirs:
+                        logging.debug(f"Skipping ignored directory: {entry.path}")
+                        continue
+                    # os.stat: DirEntry.stat reports st_dev/st_ino as 0 on Windows
+                    subdirs.append((entry.path, os.stat(entry.path, follow_symlinks=False)))
             except (PermissionError, OSError) as e:
-                logging.warning(f"Cannot access directory {current_path}: {e}")
-                return
+                logging.warning(f"Cannot access item {entry.path}: {e}")
+    return files, subdirs
 
-            # Sort for consistent ordering
-            dir_items.sort(key=lambda p: p.name)
 
-            for item in dir_items:
+def _parallel_recursive_search(
+    base_dir: str,
+    supported_extensions: frozenset[str],
+    max_depth: int,
+    file_stats: dict[str, os.stat_result] | None = None,
+    ignore_dirs: Collection[str] = frozenset(),
+) -> tuple[list[str], dict[str, str]]:
+    """
+    Recursive search that lists directories concurrently on a small thread pool.
+
+    Each directory listing runs as its own task, so slow directory reads (cold caches,
+    network filesystems) overlap instead of adding up. Results match
+    _safe_recursive_search, including its ordering.
+
+    Args:
+        base_dir: Base directory to search from
+        supported_extensions: Set of supported file extensions
+        max_depth: Maximum recursion depth
+        file_stats: If given, filled with the stat result of each discovered file
+        ignore_dirs: Directory names that are not descended into
+
+    Returns:
+        Tuple of (file_list, relative_paths_dict)
+    """
+    try:
+        base_stat = os.stat(base_dir)
+    except OSError as e:
+        logging.warning(f"Cannot access directory {base_dir}: {e}")
+        return [], {}
+
+    found = []
+    visited_dirs = {(base_stat.st_dev, base_stat.st_ino)}
+
+    # Listing is I/O-bound and os.scandir releases the GIL, so oversubscribe the CPUs
+    max_workers = min(_MAX_DISCOVERY_WORKERS, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future = executor.submit(
+            _scan_directory, base_dir, supported_extensions, file_stats, ignore_dirs
+        )
+        pending = {future: (base_dir, 0)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                current_dir, depth = pending.pop(future)
                 try:
-                    if item.is_file():
-                        if item.suffix.lower() in supported_extensions:
-                            file_path = str(item)
-                            files.append(file_path)
-                            # Calculate relative path from base directory
-                            rel_path = item.relative_to(base_path)
-                            file_relative_paths[file_path] = str(rel_path).replace("\\", "/")
-                    elif item.is_dir() and not item.is_symlink():
-                        # Recursively search subdirectories (skip symlinks for safety)
-                        # Skip default output directory to avoid re-processing generated files on
-                        # repeated runs (e.g., converting a directory twice should not pick up
-                        # the previous `markdown_output/` results).
-                        if item.name.lower() == config.DEFAULT_MARKDOWN_OUTPUT_DIR.lower():
-                            logging.debug(f"Skipping output directory: {item}")
-                            continue
-                        _search_recursive(item, current_depth + 1)
+                    dir_files, subdirs = future.result()
                 except (PermissionError, OSError) as e:
-                    logging.warning(f"Cannot access item {item}: {e}")
+                    logging.warning(f"Cannot access directory {current_dir}: {e}")
                     continue
-        except Exception as e:
-            logging.error(f"Unexpected error processing {current_path}: {e}")
-
-    _search_recursive(base_path, 0)
+                found.extend(dir_files)
+
+                for subdir, subdir_stat in subdirs:
+                    if depth + 1 > max_depth:
+                        logging.warning(f"Maximum depth {max_depth} reached at {subdir}")
+                        continue
+                    dir_key = (subdir_stat.st_dev, subdir_stat.st_ino)
+                    if dir_key in visited_dirs:
+                        logging.debug(f"Skipping already visited path: {subdir}")
+                        continue
+                    visited_dirs.add(dir_key)
+                    future = executor.submit(
+                        _scan_directory, subdir, supported_extensions, file_stats, ignore_dirs
+                    )
+                    pending[future] = (subdir, depth + 1)
+
+    rel_start = _relative_path_start(base_dir)
+    relative = {file_path: file_path[rel_start:] for file_path in found}
+    # Component-wise order is the depth-first, name-sorted order of the sequential walk
+    files = sorted(found, key=lambda f: relative[f].split(os.sep))
+    file_relative_paths = {f: relative[f].replace("\\", "/") for f in files}
     return files, file_relative_paths
 
 
-def get_supported_extensions() -> set[str]:
+def get_supported_extensions() -> frozenset[str]:
     """
     Get the complete set of supported file extensions.
 
     Returns:
-        Set of supported file extensions including the dot
+        Frozen set of supported file extensions including the dot
     """
-    return config.get_all_supported_formats()
+    return _SUPPORTED_EXTS
 
 
 def is_supported_file(file_path: str) -> bool:
@@ -143,12 +385,36 @@ def is_supported_file(file_path: str) -> bool:
     Returns:
         True if the file format is supported, False otherwise
     """
-    ext = Path(file_path).suffix.lower()
-    return ext in get_supported_extensions()
+    return _file_extension(os.path.basename(file_path)) in _SUPPORTED_EXTS
+
+
+def filter_by_extension(files: list[str], extensions: Collection[str] | None = None) -> list[str]:
+    """
+    Select the files whose extension is in a given set, preserving order.
+
+    Extensions are taken from the file name with _file_extension, so no Path
+    object is built per file.
+
+    Args:
+        files: File paths to filter
+        extensions: Lower-case extensions including the dot (default: all supported)
+
+    Returns:
+        List of the matching file paths
+    """
+    if extensions is None:
+        extensions = _SUPPORTED_EXTS
+    basename = os.path.basename
+    return [f for f in files if _file_extension(basename(f)) in extensions]
 
 
 def discover_files(
-    input_path: str, recursive: bool = True, max_depth: int = 50
+    input_path: str,
+    recursive: bool = True,
+    max_depth: int = 50,
+    parallel: bool = False,
+    file_stats: dict[str, os.stat_result] | None = None,
+    ignore_dirs: Collection[str] | None = None,
 ) -> tuple[list[str], str, dict[str, str]]:
     """
     Discover supported files from a given path (file or directory).
@@ -160,6 +426,13 @@ def discover_files(
         input_path: Path to a file or directory containing supported files
         recursive: Whether to search directories recursively (default: True)
         max_depth: Maximum recursion depth to prevent infinite loops (default: 50)
+        parallel: List directories concurrently on a thread pool during recursive search;
+                 worthwhile for large or slow (network) trees (default: False)
+        file_stats: Optional dict filled with the os.stat_result of every discovered file,
+                   taken from the directory entries during the walk so callers needing
+                   sizes or mtimes do not stat each file again (default: None)
+        ignore_dirs: Directory names skipped during recursive search, such as VCS metadata
+                    or dependency folders (default: config.DEFAULT_IGNORED_DIRS)
 
     Returns:
         Tuple containing:
@@ -171,53 +444,62 @@ def discover_files(
         FileNotFoundError: If the input path does not exist
         ValueError: If input file is not a supported format
     """
-    # Convert to pathlib.Path for better cross-platform handling
-    input_path_obj = Path(input_path).resolve()
-
-    if not input_path_obj.exists():
-        raise FileNotFoundError(f"Input path does not exist: {input_path}")
+    # Resolve once, then a single stat answers "exists", "is a directory" and "is a file"
+    resolved_path = os.path.realpath(input_path)
+    try:
+        path_stat = os.stat(resolved_path)
+    except (OSError, ValueError):
+        raise FileNotFoundError(f"Input path does not exist: {input_path}") from None
 
     files = []
     file_relative_paths = {}
     supported_extensions = get_supported_extensions()
 
-    if input_path_obj.is_dir():
+    if stat.S_ISDIR(path_stat.st_mode):
         search_type = "recursively" if recursive else "non-recursively"
         logging.info(
             f"Input is a directory. Searching {search_type} for supported files in: {input_path}"
         )
-        base_dir = str(input_path_obj)
+        base_dir = resolved_path
 
         if recursive:
+            if ignore_dirs is None:
+                ignore_dirs = config.DEFAULT_IGNORED_DIRS
             # Use safe recursive search with depth limit
+            search = _parallel_recursive_search if parallel else _safe_recursive_search
             try:
-                files, file_relative_paths = _safe_recursive_search(
-                    input_path_obj, supported_extensions, max_depth
+                files, file_relative_paths = search(
+                    base_dir, supported_extensions, max_depth, file_stats, ignore_dirs
                 )
             except Exception as e:
                 logging.error(f"Error during recursive search: {e}")
                 raise
         else:
-            # Original non-recursive behavior using pathlib
-            for file_path_obj in sorted(input_path_obj.iterdir()):
-                if file_path_obj.is_file() and file_path_obj.suffix.lower() in supported_extensions:
-                    file_path = str(file_path_obj)
-                    files.append(file_path)
-                    file_relative_paths[file_path] = file_path_obj.name
+            # Top-level files only; scandir entries carry their type from the listing
+            with os.scandir(base_dir) as it:
+                entries = sorted(it, key=lambda e: e.name)
+            is_supported_name = _extension_matcher(supported_extensions)
+            for entry in entries:
+                if entry.is_file() and is_supported_name(entry.name):
+                    if file_stats is not None:
+                        file_stats[entry.path] = entry.stat()
+                    files.append(entry.path)
+                    file_relative_paths[entry.path] = entry.name
 
         logging.info(f"Found {len(files)} supported files")
 
-    elif input_path_obj.is_file():
-        if input_path_obj.suffix.lower() not in supported_extensions:
+    elif stat.S_ISREG(path_stat.st_mode):
+        base_dir, file_name = os.path.split(resolved_path)
+        if _file_extension(file_name) not in supported_extensions:
             raise ValueError(
-                f"Input file format '{input_path_obj.suffix}' is not supported. "
+                f"Input file format '{os.path.splitext(file_name)[1]}' is not supported. "
                 f"Supported formats: {', '.join(sorted(supported_extensions))}"
             )
-        base_dir = str(input_path_obj.parent)
-        file_path = str(input_path_obj)
-        files.append(file_path)
+        files.append(resolved_path)
+        if file_stats is not None:
+            file_stats[resolved_path] = path_stat
         # For single files, relative path is just the filename
-        file_relative_paths[file_path] = input_path_obj.name
+        file_relative_paths[resolved_path] = file_name
     else:
         raise ValueError(f"Input path is neither a file nor a directory: {input_path}")
 
@@ -299,6 +581,26 @@ def discover_pdf_files(input_path: str) -> tuple[list[str], str]:
     return files, base_dir
 
 
+@lru_cache(maxsize=1024)
+def _norm_join(output_root: str, rel_dir: str) -> str:
+    """
+    Join and normalize an output directory, memoized across files.
+
+    Files in one source directory share the same (output_root, rel_dir) pair, and
+    discovery emits them together, so nearly every call after the first is a hit.
+    PurePath drops "." segments, duplicate and trailing separators, but keeps ".."
+    segments, since collapsing them lexically is wrong when a symlink is crossed.
+
+    Args:
+        output_root: Output root directory
+        rel_dir: Directory of the file relative to the output root ("" for none)
+
+    Returns:
+        Normalized output directory path
+    """
+    return str(PurePath(output_root, rel_dir))
+
+
 def get_output_file_path(
     input_path: str,
     output_dir: str | None = None,
@@ -324,40 +626,29 @@ def get_output_file_path(
     Returns:
         The full path to the output Markdown file
     """
-    # Use pathlib for better path handling
-    input_path_obj = Path(input_path)
-    output_filename = input_path_obj.stem + ".md"
+    # Plain os.path string operations: this runs once per file, and Path objects
+    # cost noticeably more to build than the joins they wrap.
+    output_filename = os.path.splitext(os.path.basename(input_path))[0] + ".md"
+
+    if not (preserve_structure and relative_path):
+        # Flat structure: only the file name matters, so skip all relative-path work.
+        # Without output_dir, use the input file's parent directory (original behavior)
+        output_root = output_dir or os.path.join(
+            os.path.dirname(input_path), config.DEFAULT_MARKDOWN_OUTPUT_DIR
+        )
+        return os.path.join(_norm_join(output_root, ""), output_filename)
 
     if output_dir:
-        output_dir_obj = Path(output_dir)
-        if preserve_structure and relative_path:
-            # Preserve directory structure: use relative path to create subdirectories
-            rel_path_obj = Path(relative_path)
-            rel_dir = rel_path_obj.parent
-            if rel_dir != Path("."):
-                output_path = output_dir_obj / rel_dir / output_filename
-            else:
-                output_path = output_dir_obj / output_filename
-        else:
-            # Flat structure: all files in the same output directory
-            output_path = output_dir_obj / output_filename
-    # Use the default output directory from config
-    elif preserve_structure and relative_path and base_dir:
+        # Preserve directory structure: use relative path to create subdirectories
+        output_root = output_dir
+    elif base_dir:
         # For preserve structure mode, use the input base directory
         # This ensures all files with preserved structure go to a unified location
         # within the input directory's root
-        base_dir_obj = Path(base_dir)
-        default_output_dir = base_dir_obj / config.DEFAULT_MARKDOWN_OUTPUT_DIR
-        rel_path_obj = Path(relative_path)
-        rel_dir = rel_path_obj.parent
-        if rel_dir != Path("."):
-            output_path = default_output_dir / rel_dir / output_filename
-        else:
-            output_path = default_output_dir / output_filename
+        output_root = os.path.join(base_dir, config.DEFAULT_MARKDOWN_OUTPUT_DIR)
     else:
-        # Use input file's parent directory for default location (original behavior)
-        input_file_dir = input_path_obj.parent
-        default_output_dir = input_file_dir / config.DEFAULT_MARKDOWN_OUTPUT_DIR
-        output_path = default_output_dir / output_filename
+        # No base directory to preserve structure under: fall back to the flat default
+        output_root = os.path.join(os.path.dirname(input_path), config.DEFAULT_MARKDOWN_OUTPUT_DIR)
+        return os.path.join(_norm_join(output_root, ""), output_filename)
 
-    return str(output_path)
+    return os.path.join(_norm_join(output_root, os.path.dirname(relative_path)), output_filename)
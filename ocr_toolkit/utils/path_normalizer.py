@@ -143,10 +143,11 @@ class PathNormalizer:
                     # Yield control to allow timeout mechanism to work
                     time.sleep(0.001)  # 1ms sleep to prevent tight loop
 
-            # Verify the copy was successful
-            if os.path.getsize(destination) != source_size:
+            # Verify the copy was successful; every byte written went through dst.write,
+            # so the running count is the destination size without another stat
+            if copied_bytes != source_size:
                 raise OSError(
-                    f"File copy incomplete: expected {source_size} bytes, got {os.path.getsize(destination)} bytes"
+                    f"File copy incomplete: expected {source_size} bytes, got {copied_bytes} bytes"
                 )
 
         except Exception as e:
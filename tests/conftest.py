@@ -3,9 +3,9 @@ Pytest configuration and fixtures for OCR toolkit tests.
 """
 
 import os
-import shutil
 import sys
-import tempfile
+from collections.abc import Mapping
+from functools import cache
 from pathlib import Path
 
 import pytest
@@ -17,6 +17,9 @@ sys.path.insert(0, str(project_root))
 # Test file paths - using the existing testFile directory
 TEST_FILES_DIR = project_root / "testFile"
 
+# Nested directory tree used by the recursive discovery tests
+NESTED_TEST_STRUCTURE_DIR = TEST_FILES_DIR / "nested_test_structure"
+
 # Individual test files
 TEST_FILES = {
     "pdf1": TEST_FILES_DIR / "instructions for writing 4-1.pdf",
@@ -26,31 +29,138 @@ TEST_FILES = {
 }
 
 
+class _LazyTestFiles(Mapping):
+    """
+    Read-only mapping of test files that only checks existence of the entries accessed.
+
+    Every value lookup, including get(), values(), items() and iteration over them,
+    goes through __getitem__, so a missing file skips the test instead of failing it.
+    """
+
+    def __init__(self, files: Mapping[str, Path]):
+        self._files = dict(files)
+
+    def __getitem__(self, name: str) -> Path:
+        path = self._files[name]
+        if not path.exists():
+            pytest.skip(f"Test file missing: {name}")
+        return path
+
+    def __iter__(self):
+        return iter(self._files)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+
 @pytest.fixture
 def test_files():
-    """Provide access to real test files."""
-    # Verify test files exist
-    missing_files = [name for name, path in TEST_FILES.items() if not path.exists()]
-    if missing_files:
-        pytest.skip(f"Test files missing: {missing_files}")
+    """Provide access to real test files, skipping when a requested file is missing."""
+    return _LazyTestFiles(TEST_FILES)
+
+
+@pytest.fixture(scope="session")
+def nested_test_structure():
+    """Provide path to the real nested test structure."""
+    if not NESTED_TEST_STRUCTURE_DIR.is_dir():
+        pytest.skip("Real nested test structure not available")
+    return NESTED_TEST_STRUCTURE_DIR
+
+
+@pytest.fixture(scope="session")
+def nested_discovery(nested_test_structure):
+    """Walk the nested test structure recursively once and share the (read-only) result."""
+    from ocr_toolkit.utils.file_discovery import discover_files
+
+    return discover_files(str(nested_test_structure))
+
+
+@pytest.fixture(scope="session")
+def nested_discovery_nonrecursive(nested_test_structure):
+    """Scan the top level of the nested test structure once and share the (read-only) result."""
+    from ocr_toolkit.utils.file_discovery import discover_files
+
+    return discover_files(str(nested_test_structure), recursive=False)
+
 
-    return TEST_FILES
+@cache
+def _cached_load_ocr_model(use_cpu: bool):
+    """Run the OCR runtime checks once per device mode for the whole session."""
+    from ocr_toolkit.utils.model_loader import load_ocr_model
+
+    return load_ocr_model(use_cpu=use_cpu)
+
+
+def _load_ocr_model_once(use_cpu: bool = False):
+    """Drop-in ``load_ocr_model`` keyed on the normalized device mode, however it is called."""
+    return _cached_load_ocr_model(bool(use_cpu))
+
+
+@pytest.fixture(scope="session")
+def ocr_model_factory():
+    """Provide a cached ``load_ocr_model`` so repeated calls skip re-verification."""
+    return _load_ocr_model_once
+
+
+@pytest.fixture(scope="session")
+def shared_ocr_pipeline(ocr_model_factory):
+    """
+    Reuse OCR processors and runtime checks across the convert CLI calls of a session.
+
+    While this fixture is active, ``load_ocr_model`` and ``create_ocr_processor_wrapper``
+    are replaced by cached versions, so each device/option combination is verified and
+    built once. The CLI code path itself is unchanged and still honours its options.
+
+    Yields:
+        Dict mapping (use_gpu, with_images, max_parallel_blocks) to its processor
+    """
+    from ocr_toolkit import ocr_processor_wrapper
+    from ocr_toolkit.cli import convert
+
+    create_wrapper = ocr_processor_wrapper.create_ocr_processor_wrapper
+    processors = {}
+
+    def create_processor(
+        use_gpu: bool = True, with_images: bool = False, max_parallel_blocks: int | None = None
+    ):
+        """Return the session processor for these options, building it on first use."""
+        key = (bool(use_gpu), bool(with_images), max_parallel_blocks)
+        if key not in processors:
+            processors[key] = create_wrapper(*key)
+        return processors[key]
+
+    try:
+        ocr_model_factory(use_cpu=True)
+        create_processor(use_gpu=False)
+    except Exception as e:
+        pytest.skip(f"OCR runtime not available: {e}")
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(convert, "load_ocr_model", ocr_model_factory)
+        mp.setattr(ocr_processor_wrapper, "create_ocr_processor_wrapper", create_processor)
+        yield processors
+
+
+@pytest.fixture
+def ocr_pipeline(shared_ocr_pipeline):
+    """Use the session OCR processors in one test and clear their per-run state afterwards."""
+    yield shared_ocr_pipeline
+    for processor in shared_ocr_pipeline.values():
+        # The output directory of the last conversion is the only state left on the handler
+        processor.handler._output_dir = None
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests."""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    shutil.rmtree(temp_dir, ignore_errors=True)
+def temp_dir(tmp_path):
+    """Provide a temporary directory for tests (pytest's tmp_path, as a string)."""
+    return str(tmp_path)
 
 
 @pytest.fixture
 def sample_text_file(temp_dir):
     """Create a sample text file for testing."""
     file_path = os.path.join(temp_dir, "sample.txt")
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write("This is sample text for testing.")
+    Path(file_path).write_text("This is sample text for testing.", encoding="utf-8")
     return file_path
 
 
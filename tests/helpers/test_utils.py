@@ -9,9 +9,13 @@ import logging
 import os
 import shutil
 import tempfile
+from pathlib import Path
 from typing import Any
 from unittest.mock import Mock
 
+# Resolved once at import; helpers below are called per test.
+_TEST_FILES_DIR = Path(__file__).resolve().parent.parent.parent / "testFile"
+
 
 class FileManagerHelper:
     """
@@ -54,12 +58,8 @@ class FileManagerHelper:
             Path to the created temporary file
         """
         fd, temp_file = tempfile.mkstemp(suffix=suffix, prefix=prefix)
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                f.write(content)
-        except:
-            os.close(fd)
-            raise
+        os.close(fd)
+        Path(temp_file).write_text(content, encoding="utf-8")
 
         self.temp_files.append(temp_file)
         return temp_file
@@ -146,18 +146,21 @@ def create_test_directory_structure(base_dir: str, structure: dict[str, Any]) ->
         else:
             # It's a file
             os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(content if content is not None else "")
+            Path(path).write_text(content if content is not None else "", encoding="utf-8")
 
 
 def suppress_logging(level: int = logging.CRITICAL) -> None:
     """
     Suppress logging output during tests.
 
+    Uses logging.disable so records at or below ``level`` are dropped before a
+    LogRecord is built, regardless of per-logger levels. Undo it with
+    ``logging.disable(logging.NOTSET)``.
+
     Args:
-        level: Logging level to set (default: CRITICAL to suppress most output)
+        level: Highest logging level to disable (default: CRITICAL to suppress all output)
     """
-    logging.getLogger().setLevel(level)
+    logging.disable(level)
 
 
 def create_mock_ocr_model():
@@ -183,8 +186,7 @@ def get_test_file_path(filename: str) -> str:
     Returns:
         Absolute path to the test file
     """
-    test_dir = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(test_dir, "..", "..", "testFile", filename)
+    return str(_TEST_FILES_DIR / filename)
 
 
 def assert_file_exists(file_path: str) -> None:
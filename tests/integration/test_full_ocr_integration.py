@@ -2,141 +2,203 @@
 Complete end-to-end OCR integration tests for testFile directory.
 
 These tests actually run OCR processing on real files to ensure the entire pipeline works.
+They can run in parallel with ``pytest -n auto --dist loadgroup``; OCR tests share one
+xdist group so the session OCR pipeline is built on a single worker only.
 """
 
+import hashlib
 import os
 import shutil
-import tempfile
 import time
-import pytest
+from functools import cache
 from pathlib import Path
+from unittest.mock import Mock
 
-import sys
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
+import pytest
 
-class TestFullOCRIntegration:
-    """Complete OCR integration tests using real files from testFile."""
+from ocr_toolkit import ocr_processor_wrapper
+from ocr_toolkit.cli import convert
+from ocr_toolkit.processors.excel_processor import ExcelDataProcessor
+from ocr_toolkit.utils.file_discovery import discover_files
 
-    @pytest.fixture
-    def testfile_dir(self):
-        """Provide path to testFile directory."""
-        test_path = project_root / "testFile"
-        if not test_path.exists():
-            pytest.skip("testFile directory not available")
-        return test_path
+project_root = Path(__file__).parent.parent.parent
 
-    @pytest.fixture
-    def temp_output_dir(self):
-        """Create temporary output directory for tests."""
-        temp_dir = tempfile.mkdtemp(prefix="ocr_full_test_")
-        yield temp_dir
-        # Cleanup after test
-        if os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir, ignore_errors=True)
+# Sample files under testFile, keyed by the kind passed to the sample_file fixture
+SAMPLE_FILES = {
+    "pdf": "instructions for writing 4-1.pdf",
+    "image": "choice question.jpg",
+    # May contain various non-Latin characters
+    "chinese_pdf": "UCB Referencing and Style Guide 2024-25.pdf",
+    "excel": "excel_samples/Income Statement Solutions.xlsx",
+}
+
+# Small placeholder files under testFile used by the mocked CLI wiring tests
+WIRING_SAMPLES = ["dummy.pdf", "dummy.jpg"]
+
+# Markdown returned by the mocked OCR pipeline
+MOCK_MARKDOWN = "# mock\n\nhello\n"
+# MOCK_MARKDOWN as written to disk (outputs use platform-native line endings)
+MOCK_MARKDOWN_BYTES = MOCK_MARKDOWN.replace("\n", os.linesep).encode("utf-8")
+
+# Opt-in OCR output cache (set OCR_TEST_CACHE=1), keyed by sample content, CLI options
+# and the ocr_toolkit sources, so any code change forces a real OCR run
+OCR_CACHE_DIR = project_root / "tests" / ".ocr_cache"
+OCR_SOURCE_DIR = project_root / "ocr_toolkit"
+
+# At least one of these should appear in a scan of testFile
+EXPECTED_TESTFILE_EXTENSIONS = frozenset({".pdf", ".docx", ".jpg"})
+
+
+@cache
+def _ocr_source_digest():
+    """Hash the ocr_toolkit sources once per session."""
+    digest = hashlib.sha256()
+    for source in sorted(OCR_SOURCE_DIR.rglob("*.py")):
+        digest.update(source.relative_to(OCR_SOURCE_DIR).as_posix().encode("utf-8"))
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _ocr_cache_key(sample_file, cli_args):
+    """Fingerprint a sample file, the CLI options and the code that produce its output."""
+    digest = hashlib.sha256(sample_file.read_bytes())
+    digest.update("\0".join(cli_args).encode("utf-8"))
+    digest.update(_ocr_source_digest().encode("ascii"))
+    return digest.hexdigest()
+
+
+def _convert_with_cache(request, sample_file, output_dir, cli_args):
+    """
+    Run ocr-convert on one file, optionally reusing Markdown cached for the same code.
+
+    The cache is off unless OCR_TEST_CACHE=1. The shared OCR pipeline is only
+    requested on a cache miss, so fully cached runs never load the OCR runtime.
+    """
+    output_path = Path(output_dir) / f"{sample_file.stem}.md"
+    use_cache = os.environ.get("OCR_TEST_CACHE") == "1"
+    cached = OCR_CACHE_DIR / f"{_ocr_cache_key(sample_file, cli_args)}.md"
+
+    if use_cache and cached.exists():
+        shutil.copyfile(cached, output_path)
+        return output_path
+
+    request.getfixturevalue("ocr_pipeline")
+
+    assert convert.main([str(sample_file), "--output-dir", str(output_dir), *cli_args]) == 0
+
+    if use_cache and output_path.exists():
+        OCR_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(output_path, cached)
+    return output_path
+
+
+@pytest.fixture(scope="session")
+def testfile_dir():
+    """Provide path to testFile directory."""
+    test_path = project_root / "testFile"
+    if not test_path.exists():
+        pytest.skip("testFile directory not available")
+    return test_path
+
+
+@pytest.fixture(scope="module")
+def _module_temp_root(tmp_path_factory):
+    """One pytest-managed temp root per module (per xdist worker under pytest-xdist)."""
+    return tmp_path_factory.mktemp("ocr_full_test")
+
+
+@pytest.fixture
+def temp_output_dir(_module_temp_root, request):
+    """Provide a per-test output directory under the module temp root."""
+    temp_dir = _module_temp_root / request.node.name
+    temp_dir.mkdir()
+    return str(temp_dir)
+
+
+@pytest.fixture
+def mock_ocr_pipeline(monkeypatch):
+    """Make the convert CLI build a fake OCR processor and skip the runtime checks."""
+    processor = Mock()
+    processor.process_document.side_effect = lambda file_path, args=None: {
+        "file_path": file_path,
+        "file_name": os.path.basename(file_path),
+        "success": True,
+        "chosen_method": "ocr",
+        "final_content": MOCK_MARKDOWN,
+        "processing_time": 0.0,
+        "pages": 1,
+        "error": "",
+    }
+    processor.get_detailed_statistics.return_value = {"success_rate": 100.0}
+
+    monkeypatch.setattr(convert, "load_ocr_model", Mock())
+    monkeypatch.setattr(
+        ocr_processor_wrapper, "create_ocr_processor_wrapper", Mock(return_value=processor)
+    )
+    return processor
 
-    @pytest.fixture
-    def sample_pdf(self, testfile_dir):
-        """Provide sample PDF file."""
-        pdf_file = testfile_dir / "instructions for writing 4-1.pdf"
-        if not pdf_file.exists():
-            pytest.skip("Sample PDF not available")
-        return pdf_file
 
-    @pytest.fixture
-    def sample_image(self, testfile_dir):
-        """Provide sample image file."""
-        img_file = testfile_dir / "choice question.jpg"
-        if not img_file.exists():
-            pytest.skip("Sample image not available")
-        return img_file
+class TestFullOCRIntegration:
+    """Complete OCR integration tests using real files from testFile."""
 
     @pytest.fixture
-    def sample_excel(self, testfile_dir):
-        """Provide sample Excel file."""
-        excel_file = testfile_dir / "excel_samples" / "Income Statement Solutions.xlsx"
-        if not excel_file.exists():
-            pytest.skip("Sample Excel not available")
-        return excel_file
-
-    def test_convert_pdf_via_cli(self, sample_pdf, temp_output_dir):
-        """Test PDF conversion using CLI."""
-        from ocr_toolkit.cli.convert import main as convert_main
-        import sys
-        from io import StringIO
-        import argparse
-
-        output_file = os.path.join(temp_output_dir, "output.md")
-
-        # Simulate CLI arguments
-        old_argv = sys.argv
-        sys.argv = [
-            "ocr-convert",
-            str(sample_pdf),
-            "--output-dir", temp_output_dir,
-            "--cpu",  # Use CPU for testing
-        ]
-
-        try:
-            convert_main()
-        except SystemExit as e:
-            # CLI calls sys.exit, that's expected
-            if e.code not in [0, None]:
-                pytest.fail(f"CLI exited with code {e.code}")
-        finally:
-            sys.argv = old_argv
+    def sample_file(self, request, testfile_dir):
+        """Provide the sample file selected by indirect parametrization."""
+        kind = request.param
+        sample = testfile_dir / SAMPLE_FILES[kind]
+        if not sample.exists():
+            pytest.skip(f"Sample {kind} not available")
+        return sample
+
+    @pytest.mark.parametrize(
+        "sample_file, extra_args",
+        [
+            ("pdf", []),
+            ("image", []),
+            ("chinese_pdf", ["--pages", "1"]),  # Just process first page for speed
+        ],
+        indirect=["sample_file"],
+    )
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("ocr")
+    def test_convert_via_cli(self, request, sample_file, extra_args, temp_output_dir):
+        """Test PDF, image and Chinese PDF conversion using CLI with one shared OCR pipeline."""
+        # Use CPU for testing
+        cli_args = ["--cpu", *extra_args]
+        output_path = _convert_with_cache(request, sample_file, temp_output_dir, cli_args)
 
         # Check if output was created
-        output_path = Path(temp_output_dir) / f"{sample_pdf.stem}.md"
         assert output_path.exists(), f"Output file not created: {output_path}"
 
-        content = output_path.read_text(encoding='utf-8')
-        assert len(content) > 0, "Output should not be empty"
-
-        print(f"\nPDF CLI test passed - Content length: {len(content)}")
-
-    def test_convert_image_via_cli(self, sample_image, temp_output_dir):
-        """Test image conversion using CLI."""
-        import sys
+        output_size = output_path.stat().st_size
+        assert output_size > 0, "Output should not be empty"
 
-        output_file = os.path.join(temp_output_dir, "output.md")
+        print(f"\n{sample_file.name} CLI test passed - Output size: {output_size} bytes")
 
-        # Simulate CLI arguments
-        old_argv = sys.argv
-        sys.argv = [
-            "ocr-convert",
-            str(sample_image),
-            "--output-dir", temp_output_dir,
-            "--cpu",
-        ]
-
-        try:
-            from ocr_toolkit.cli.convert import main as convert_main
-            convert_main()
-        except SystemExit as e:
-            if e.code not in [0, None]:
-                pytest.fail(f"CLI exited with code {e.code}")
-        finally:
-            sys.argv = old_argv
-
-        # Check if output was created
-        output_path = Path(temp_output_dir) / f"{sample_image.stem}.md"
-        assert output_path.exists(), f"Output file not created: {output_path}"
+    @pytest.mark.parametrize("sample_name", WIRING_SAMPLES)
+    def test_convert_via_cli_wiring(
+        self, mock_ocr_pipeline, testfile_dir, sample_name, temp_output_dir
+    ):
+        """Test CLI discovery, OCR dispatch and output writing with a mocked OCR pipeline."""
+        sample = testfile_dir / sample_name
+        if not sample.exists():
+            pytest.skip(f"Sample {sample_name} not available")
 
-        content = output_path.read_text(encoding='utf-8')
-        assert len(content) > 0
+        assert convert.main([str(sample), "--output-dir", temp_output_dir, "--cpu"]) == 0
 
-        print(f"\nImage CLI test passed - Content length: {len(content)}")
+        # The mock controls the content, so the written size is enough to check the write path
+        output_path = Path(temp_output_dir) / f"{sample.stem}.md"
+        assert output_path.stat().st_size == len(MOCK_MARKDOWN_BYTES)
+        mock_ocr_pipeline.process_document.assert_called_once()
+        assert mock_ocr_pipeline.process_document.call_args.args[0] == str(sample)
 
-    def test_excel_extraction(self, sample_excel, temp_output_dir):
+    @pytest.mark.parametrize("sample_file", ["excel"], indirect=True)
+    def test_excel_extraction(self, sample_file, temp_output_dir):
         """Test Excel data extraction."""
-        from ocr_toolkit.processors.excel_processor import ExcelDataProcessor
-
         start_time = time.time()
 
         processor = ExcelDataProcessor()
-        result = processor.process(str(sample_excel))
+        result = processor.process(str(sample_file))
 
         processing_time = time.time() - start_time
 
@@ -149,16 +211,10 @@ class TestFullOCRIntegration:
 
         print(f"\nExcel extraction test passed - Time: {processing_time:.2f}s, Sheets: {result.pages}")
 
-    def test_convert_directory_batch(self, testfile_dir, temp_output_dir):
+    def test_convert_directory_batch(self, nested_discovery, temp_output_dir):
         """Test batch conversion of multiple files."""
-        from ocr_toolkit.utils.file_discovery import discover_files
-
         # Use nested_test_structure for batch test (smaller file set)
-        test_dir = testfile_dir / "nested_test_structure"
-        if not test_dir.exists():
-            pytest.skip("nested_test_structure not available")
-
-        files, base_dir, _ = discover_files(str(test_dir), recursive=True)
+        files, base_dir, _ = nested_discovery
 
         # Should find multiple files
         assert len(files) >= 2, f"Expected multiple files, found {len(files)}"
@@ -167,48 +223,13 @@ class TestFullOCRIntegration:
 
     def test_full_testfile_directory(self, testfile_dir, temp_output_dir):
         """Test processing the entire testFile directory."""
-        from ocr_toolkit.utils.file_discovery import discover_files
-
         files, base_dir, _ = discover_files(str(testfile_dir), recursive=False)
 
         # Should find several files
         assert len(files) >= 5, f"Expected at least 5 files, found {len(files)}"
 
         # Verify we have expected file types
-        extensions = {Path(f).suffix.lower() for f in files}
-        assert ".pdf" in extensions or ".docx" in extensions or ".jpg" in extensions
+        extensions = frozenset(Path(f).suffix.lower() for f in files)
+        assert not extensions.isdisjoint(EXPECTED_TESTFILE_EXTENSIONS)
 
         print(f"\ntestFile directory scan passed - Found {len(files)} files")
-
-    def test_chinese_pdf_support(self, testfile_dir, temp_output_dir):
-        """Test that Chinese text in PDFs is handled correctly."""
-        # This test uses the UCB Referencing PDF which may contain various characters
-        chinese_pdf = testfile_dir / "UCB Referencing and Style Guide 2024-25.pdf"
-        if not chinese_pdf.exists():
-            pytest.skip("UCB Referencing PDF not available")
-
-        import sys
-        old_argv = sys.argv
-        sys.argv = [
-            "ocr-convert",
-            str(chinese_pdf),
-            "--output-dir", temp_output_dir,
-            "--cpu",
-            "--pages", "1",  # Just process first page for speed
-        ]
-
-        try:
-            from ocr_toolkit.cli.convert import main as convert_main
-            convert_main()
-        except SystemExit as e:
-            if e.code not in [0, None]:
-                pytest.fail(f"CLI exited with code {e.code}")
-        finally:
-            sys.argv = old_argv
-
-        # Check output
-        output_path = Path(temp_output_dir) / f"{chinese_pdf.stem}.md"
-        if output_path.exists():
-            content = output_path.read_text(encoding='utf-8')
-            assert len(content) > 0
-            print(f"\nChinese PDF test passed - Content length: {len(content)}")
@@ -6,46 +6,36 @@ with actual OCR-processable files and doesn't experience hanging/freezing issues
 """
 
 import os
-import shutil
-import sys
-import tempfile
 import time
 from pathlib import Path
 
 import pytest
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
-
 from ocr_toolkit.utils.file_discovery import (
     discover_files,
     get_directory_cache,
     get_output_file_path,
+    get_supported_extensions,
 )
 
 
+@pytest.fixture(scope="module")
+def _module_temp_root(tmp_path_factory):
+    """One pytest-managed temp root per module (per xdist worker under pytest-xdist)."""
+    return tmp_path_factory.mktemp("ocr_preserve_test")
+
+
+@pytest.fixture
+def temp_output_dir(_module_temp_root, request):
+    """Provide a per-test output directory under the module temp root."""
+    temp_dir = _module_temp_root / request.node.name
+    temp_dir.mkdir()
+    return str(temp_dir)
+
+
 class TestPreserveStructureIntegration:
     """Integration tests for preserve structure functionality."""
 
-    @pytest.fixture
-    def nested_test_structure(self):
-        """Provide path to the real nested test structure."""
-        test_path = project_root / "testFile" / "nested_test_structure"
-        if not test_path.exists():
-            pytest.skip("Real nested test structure not available")
-        return test_path
-
-    @pytest.fixture
-    def temp_output_dir(self):
-        """Create temporary output directory for tests."""
-        temp_dir = tempfile.mkdtemp(prefix="ocr_preserve_test_")
-        yield temp_dir
-        # Cleanup after test
-        if os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir, ignore_errors=True)
-
     def test_discover_files_with_real_nested_structure(self, nested_test_structure):
         """Test file discovery works correctly with real nested structure."""
         start_time = time.time()
@@ -80,11 +70,24 @@ class TestPreserveStructureIntegration:
                 f"Relative path should not start with \\: {rel_path}"
             )
 
+    def test_parallel_discovery_with_real_nested_structure(
+        self, nested_test_structure, nested_discovery
+    ):
+        """Test parallel discovery finds the same files as the sequential walk."""
+        start_time = time.time()
+
+        files, base_dir, relative_paths = discover_files(str(nested_test_structure), parallel=True)
+
+        discovery_time = time.time() - start_time
+        assert discovery_time < 5.0, f"Parallel discovery took too long: {discovery_time:.2f}s"
+        assert len(files) == 7
+        assert (files, base_dir, relative_paths) == nested_discovery
+
     def test_output_path_generation_with_structure_preservation(
-        self, nested_test_structure, temp_output_dir
+        self, nested_discovery, temp_output_dir
     ):
         """Test output path generation preserves directory structure correctly."""
-        files, base_dir, relative_paths = discover_files(str(nested_test_structure))
+        files, base_dir, relative_paths = nested_discovery
 
         # Test output path generation for each discovered file
         generated_paths = []
@@ -117,27 +120,27 @@ class TestPreserveStructureIntegration:
             "All output paths should be unique"
         )
 
-    def test_directory_cache_performance(self, nested_test_structure, temp_output_dir):
+    def test_directory_cache_performance(self, nested_discovery, temp_output_dir):
         """Test directory cache improves performance and prevents redundant operations."""
-        files, base_dir, relative_paths = discover_files(str(nested_test_structure))
+        files, base_dir, relative_paths = nested_discovery
 
         # Get directory cache instance
         dir_cache = get_directory_cache()
         dir_cache.reset()
 
-        # Simulate directory creation for all output paths
+        # Simulate directory creation for all output paths, one call per unique directory
         start_time = time.time()
-        created_dirs = set()
-
-        for file_path in files:
-            relative_path = relative_paths[file_path]
-            output_path = get_output_file_path(
-                file_path, temp_output_dir, preserve_structure=True, relative_path=relative_path
+        output_paths = [
+            get_output_file_path(
+                file_path,
+                temp_output_dir,
+                preserve_structure=True,
+                relative_path=relative_paths[file_path],
             )
-
-            output_dir = os.path.dirname(output_path)
-            dir_cache.ensure_directory(output_dir)
-            created_dirs.add(output_dir)
+            for file_path in files
+        ]
+        created_dirs = {os.path.dirname(p) for p in output_paths}
+        dir_cache.ensure_directories(created_dirs)
 
         cache_time = time.time() - start_time
 
@@ -151,13 +154,12 @@ class TestPreserveStructureIntegration:
         # Cache should have prevented redundant operations by tracking created directories
         assert len(created_dirs) >= 3, "Should create multiple nested directories"
 
-    def test_non_recursive_vs_recursive_behavior(self, nested_test_structure):
+    def test_non_recursive_vs_recursive_behavior(
+        self, nested_discovery, nested_discovery_nonrecursive
+    ):
         """Test recursive vs non-recursive discovery behavior."""
-        # Test recursive discovery (default)
-        recursive_files, _, _ = discover_files(str(nested_test_structure), recursive=True)
-
-        # Test non-recursive discovery
-        non_recursive_files, _, _ = discover_files(str(nested_test_structure), recursive=False)
+        recursive_files, _, _ = nested_discovery
+        non_recursive_files, _, _ = nested_discovery_nonrecursive
 
         # Recursive should find more files than non-recursive
         assert len(recursive_files) > len(non_recursive_files), (
@@ -215,11 +217,9 @@ class TestPreserveStructureIntegration:
             assert output_path, f"Should generate valid output path for {file_path}"
             assert temp_output_dir in output_path, "Output path should be in temp directory"
 
-    def test_mixed_file_extensions_filtering(self, nested_test_structure):
+    def test_mixed_file_extensions_filtering(self, nested_discovery):
         """Test that only supported file extensions are discovered."""
-        from ocr_toolkit.utils.file_discovery import get_supported_extensions
-
-        files, _, _ = discover_files(str(nested_test_structure))
+        files, _, _ = nested_discovery
         supported_exts = get_supported_extensions()
 
         # All discovered files should have supported extensions
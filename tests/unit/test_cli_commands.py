@@ -2,34 +2,21 @@
 Unit tests for CLI commands.
 """
 
-import os
-import shutil
-import sys
-import tempfile
+from argparse import Namespace
 
 import pytest
 
-# Add project root to path
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
-
 from ocr_toolkit.cli import convert
 
 
-class TestCLICommands:
-    """Test cases for CLI commands."""
-
-    def setup_method(self):
-        """Setup test fixtures before each test method."""
-        self.test_dir = tempfile.mkdtemp()
+@pytest.fixture(scope="module")
+def convert_parser():
+    """Build the convert parser once for the tests that only read from it."""
+    return convert.create_parser()
 
-    def teardown_method(self):
-        """Cleanup after each test method."""
-        # Use pathlib for robust cleanup across OCR runtime dependencies
-        import pathlib
 
-        test_dir_path = pathlib.Path(self.test_dir)
-        if test_dir_path.exists():
-            shutil.rmtree(self.test_dir, ignore_errors=True)
+class TestCLICommands:
+    """Test cases for CLI commands."""
 
     def test_convert_create_parser(self):
         """Test convert command parser creation."""
@@ -39,25 +26,32 @@ class TestCLICommands:
 
     def test_convert_validate_arguments_list_formats(self):
         """Test convert argument validation for list-formats."""
-        from argparse import Namespace
-
         args = Namespace(list_formats=True, workers=4)
         assert convert.validate_arguments(args) is True
 
     def test_convert_validate_arguments_no_input(self):
         """Test convert argument validation without input path."""
-        from argparse import Namespace
-
         args = Namespace(list_formats=False, input_path=None, workers=4)
         assert convert.validate_arguments(args) is False
 
     def test_convert_validate_arguments_invalid_workers(self):
         """Test convert argument validation with invalid workers."""
-        from argparse import Namespace
-
         args = Namespace(list_formats=False, input_path="/test", workers=0)
         assert convert.validate_arguments(args) is False
 
+    def test_convert_parallel_discovery_flag(self, convert_parser):
+        """Test that parallel directory discovery is opt-in."""
+        args = convert_parser.parse_args(["docs"])
+        assert args.parallel_discovery is False
+        args = convert_parser.parse_args(["docs", "--parallel-discovery"])
+        assert args.parallel_discovery is True
+
+    def test_convert_ignore_dir_flag(self, convert_parser):
+        """Test that --ignore-dir collects repeated directory names."""
+        assert convert_parser.parse_args(["docs"]).ignore_dir == []
+        args = convert_parser.parse_args(["docs", "--ignore-dir", "build", "--ignore-dir", "dist"])
+        assert args.ignore_dir == ["build", "dist"]
+
     def test_convert_list_supported_formats(self):
         """Test list supported formats function."""
         # This function now has safe fallback logic, just test it doesn't crash
@@ -66,13 +60,12 @@ class TestCLICommands:
         except Exception as e:
             pytest.fail(f"list_supported_formats() should not raise an exception: {e}")
 
-    def test_convert_help_functionality(self):
+    def test_convert_help_functionality(self, convert_parser):
         """Test that convert command can show help without errors."""
 
-        # Create parser and test help doesn't raise exceptions
-        parser = convert.create_parser()
+        # Test help doesn't raise exceptions
         try:
-            parser.parse_args(["--help"])
+            convert_parser.parse_args(["--help"])
         except SystemExit as e:
             # argparse exits with code 0 for help
             assert e.code == 0
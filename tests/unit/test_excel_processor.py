@@ -2,153 +2,141 @@
 Unit tests for Excel data processor module.
 """
 
-import os
-import sys
-import tempfile
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-# Add project root to path
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
-
 from ocr_toolkit.processors.base import ProcessingResult
 from ocr_toolkit.processors.excel_processor import ExcelDataProcessor
 
 
+@pytest.fixture(scope="class")
+def processor():
+    """Share one ExcelDataProcessor per test class; the processor keeps no per-file state."""
+    return ExcelDataProcessor()
+
+
 class TestExcelDataProcessor:
     """Test cases for ExcelDataProcessor class."""
 
-    def setup_method(self):
-        """Setup test fixtures before each test method."""
-        self.processor = ExcelDataProcessor()
-
-    def test_init(self):
+    def test_init(self, processor):
         """Test ExcelDataProcessor initialization."""
-        assert self.processor is not None
-        assert hasattr(self.processor, "logger")
-
-    def test_supports_format_xlsx(self):
-        """Test format support for .xlsx files."""
-        assert self.processor.supports_format(".xlsx") is True
-        assert self.processor.supports_format(".XLSX") is True
-        assert self.processor.supports_format("xlsx") is True
-
-    def test_supports_format_xls(self):
-        """Test format support for .xls files."""
-        assert self.processor.supports_format(".xls") is True
-        assert self.processor.supports_format(".XLS") is True
-        assert self.processor.supports_format("xls") is True
-
-    def test_supports_format_unsupported(self):
-        """Test format support for unsupported files."""
-        assert self.processor.supports_format(".pdf") is False
-        assert self.processor.supports_format(".docx") is False
-        assert self.processor.supports_format(".txt") is False
-        assert self.processor.supports_format(".csv") is False
-
-    def test_get_supported_formats(self):
+        assert processor is not None
+        assert hasattr(processor, "logger")
+
+    @pytest.mark.parametrize(
+        "extension, expected",
+        [
+            (".xlsx", True),
+            (".XLSX", True),
+            ("xlsx", True),
+            (".xls", True),
+            (".XLS", True),
+            ("xls", True),
+            (".pdf", False),
+            (".docx", False),
+            (".txt", False),
+            (".csv", False),
+        ],
+    )
+    def test_supports_format(self, processor, extension, expected):
+        """Test format support for Excel and non-Excel extensions."""
+        assert processor.supports_format(extension) is expected
+
+    def test_supported_formats_constant(self):
+        """Test that the supported extensions are a fixed class-level frozenset."""
+        formats = ExcelDataProcessor.SUPPORTED_FORMATS
+        assert isinstance(formats, frozenset)
+        assert formats == {".xlsx", ".xls"}
+
+    def test_get_supported_formats(self, processor):
         """Test getting list of supported formats."""
-        formats = self.processor.get_supported_formats()
+        formats = processor.get_supported_formats()
         assert isinstance(formats, list)
         assert ".xls" in formats
         assert ".xlsx" in formats
         assert len(formats) == 2
 
-    def test_process_invalid_file(self):
+    def test_process_invalid_file(self, processor):
         """Test processing non-existent file."""
-        result = self.processor.process("nonexistent.xlsx")
+        result = processor.process("nonexistent.xlsx")
         assert isinstance(result, ProcessingResult)
         assert result.success is False
         assert "invalid file" in result.error.lower()
 
-    def test_process_unsupported_format(self):
+    def test_process_unsupported_format(self, processor, tmp_path):
         """Test processing unsupported format."""
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            f.write(b"test")
-            temp_path = f.name
-
-        try:
-            result = self.processor.process(temp_path)
-            assert isinstance(result, ProcessingResult)
-            assert result.success is False
-            assert "unsupported file format" in result.error.lower()
-        finally:
-            os.unlink(temp_path)
+        temp_path = tmp_path / "test.txt"
+        temp_path.write_bytes(b"test")
+
+        result = processor.process(str(temp_path))
+        assert isinstance(result, ProcessingResult)
+        assert result.success is False
+        assert "unsupported file format" in result.error.lower()
 
     @patch("openpyxl.load_workbook")
-    def test_process_password_protected(self, mock_load):
+    def test_process_password_protected(self, mock_load, processor, tmp_path):
         """Test processing password-protected Excel file."""
         mock_load.side_effect = Exception("password protected workbook")
 
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as f:
-            temp_path = f.name
+        temp_path = tmp_path / "test.xlsx"
+        temp_path.touch()
 
-        try:
-            result = self.processor.process(temp_path)
-            assert isinstance(result, ProcessingResult)
-            assert result.success is False
-            assert "password" in result.error.lower()
-        finally:
-            os.unlink(temp_path)
+        result = processor.process(str(temp_path))
+        assert isinstance(result, ProcessingResult)
+        assert result.success is False
+        assert "password" in result.error.lower()
 
     @patch("openpyxl.load_workbook")
-    def test_process_corrupted_file(self, mock_load):
+    def test_process_corrupted_file(self, mock_load, processor, tmp_path):
         """Test processing corrupted Excel file."""
         mock_load.side_effect = Exception("invalid file format")
 
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            result = self.processor.process(temp_path)
-            assert isinstance(result, ProcessingResult)
-            assert result.success is False
-            assert "corrupt" in result.error.lower() or "invalid" in result.error.lower()
-        finally:
-            os.unlink(temp_path)
-
-    def test_format_cell_value_none(self):
-        """Test formatting None cell values."""
-        assert self.processor._format_cell_value(None) == ""
-
-    def test_format_cell_value_integer(self):
-        """Test formatting integer cell values."""
-        assert self.processor._format_cell_value(42) == "42"
-        assert self.processor._format_cell_value(0) == "0"
-        assert self.processor._format_cell_value(-100) == "-100"
-
-    def test_format_cell_value_float(self):
-        """Test formatting float cell values."""
-        assert self.processor._format_cell_value(3.14) == "3.14"
-        assert self.processor._format_cell_value(100.0) == "100"
-        assert self.processor._format_cell_value(0.5) == "0.50"
-
-    def test_format_cell_value_string(self):
-        """Test formatting string cell values."""
-        assert self.processor._format_cell_value("Hello") == "Hello"
-        assert self.processor._format_cell_value("") == ""
-
-    def test_format_cell_value_with_pipe(self):
+        temp_path = tmp_path / "test.xlsx"
+        temp_path.touch()
+
+        result = processor.process(str(temp_path))
+        assert isinstance(result, ProcessingResult)
+        assert result.success is False
+        assert "corrupt" in result.error.lower() or "invalid" in result.error.lower()
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (None, ""),
+            (42, "42"),
+            (0, "0"),
+            (-100, "-100"),
+            (3.14, "3.14"),
+            (100.0, "100"),
+            (0.5, "0.50"),
+            ("Hello", "Hello"),
+            ("", ""),
+        ],
+    )
+    def test_format_cell_value_scalar(self, processor, value, expected):
+        """Test formatting None, integer, float and string cell values."""
+        assert processor._format_cell_value(value) == expected
+
+    def test_format_cell_value_with_pipe(self, processor):
         """Test formatting cell values with pipe character."""
-        result = self.processor._format_cell_value("value | with | pipes")
+        result = processor._format_cell_value("value | with | pipes")
         assert "\\|" in result
         assert "|" not in result or result.count("|") == result.count("\\|")
 
-    def test_format_cell_value_long_string(self):
+    def test_format_cell_value_long_string(self, processor):
         """Test formatting very long cell values."""
         long_string = "a" * 200
-        result = self.processor._format_cell_value(long_string)
+        result = processor._format_cell_value(long_string)
         assert len(result) <= 100
         assert result.endswith("...")
 
-    def test_format_cell_value_datetime(self):
+    def test_format_cell_value_datetime(self, processor):
         """Test formatting datetime cell values."""
-        from datetime import datetime
-
         dt = datetime(2024, 12, 5, 14, 30, 0)
-        result = self.processor._format_cell_value(dt)
+        result = processor._format_cell_value(dt)
         assert "2024-12-05" in result
         assert "14:30:00" in result
 
@@ -156,11 +144,7 @@ class TestExcelDataProcessor:
 class TestExcelDataProcessorIntegration:
     """Integration tests using real openpyxl."""
 
-    def setup_method(self):
-        """Setup test fixtures."""
-        self.processor = ExcelDataProcessor()
-
-    def test_process_real_excel_file(self):
+    def test_process_real_excel_file(self, processor):
         """Test processing a real Excel file if samples exist."""
         # Try to find sample Excel files
         project_root = Path(__file__).parent.parent.parent
@@ -178,7 +162,7 @@ class TestExcelDataProcessorIntegration:
         if not excel_file:
             pytest.skip("No sample Excel files found for integration testing")
 
-        result = self.processor.process(excel_file)
+        result = processor.process(excel_file)
 
         assert isinstance(result, ProcessingResult)
         assert result.success is True
@@ -193,7 +177,7 @@ class TestExcelDataProcessorIntegration:
         assert "## Sheet:" in result.content  # Sheet headers
         assert "|" in result.content  # Table rows
 
-    def test_process_real_file_sheet_count(self):
+    def test_process_real_file_sheet_count(self, processor):
         """Test that sheet count is correctly reported."""
         project_root = Path(__file__).parent.parent.parent
         sample_file = project_root / "testFile/excel_samples/Trial Balance Solutions.xlsx"
@@ -203,13 +187,13 @@ class TestExcelDataProcessorIntegration:
 
         sample_file = str(sample_file)
 
-        result = self.processor.process(sample_file)
+        result = processor.process(sample_file)
 
         assert result.success is True
         # Trial Balance Solutions.xlsx has 6 sheets
         assert result.pages == 6
 
-    def test_process_real_file_content_structure(self):
+    def test_process_real_file_content_structure(self, processor):
         """Test that processed content has proper Markdown structure."""
         project_root = Path(__file__).parent.parent.parent
         sample_file = project_root / "testFile/excel_samples/Trial Balance Solutions.xlsx"
@@ -219,7 +203,7 @@ class TestExcelDataProcessorIntegration:
 
         sample_file = str(sample_file)
 
-        result = self.processor.process(sample_file)
+        result = processor.process(sample_file)
 
         assert result.success is True
 
@@ -2,12 +2,45 @@
 Test cases for enhanced file discovery functionality with recursive search and structure preservation.
 """
 
+import contextlib
+import os
 from pathlib import Path
-
-import pytest
+from unittest.mock import patch
 
 from ocr_toolkit import config
-from ocr_toolkit.utils.file_discovery import discover_files, get_output_file_path
+from ocr_toolkit.utils.file_discovery import (
+    DirectoryCache,
+    discover_files,
+    filter_by_extension,
+    get_output_file_path,
+    get_supported_extensions,
+)
+
+
+class _ZeroInodeEntry:
+    """DirEntry wrapper whose stat() reports st_ino and st_dev as 0, as on Windows."""
+
+    def __init__(self, entry):
+        self._entry = entry
+
+    def __getattr__(self, name):
+        return getattr(self._entry, name)
+
+    def stat(self, *, follow_symlinks=True):
+        fields = list(self._entry.stat(follow_symlinks=follow_symlinks))
+        fields[1:3] = [0, 0]  # st_ino, st_dev
+        return os.stat_result(fields)
+
+
+def _zero_inode_scandir(real_scandir):
+    """Build an os.scandir replacement yielding _ZeroInodeEntry objects."""
+
+    def scandir(path):
+        with real_scandir(path) as it:
+            entries = [_ZeroInodeEntry(entry) for entry in it]
+        return contextlib.nullcontext(entries)
+
+    return scandir
 
 
 class TestEnhancedFileDiscovery:
@@ -52,6 +85,22 @@ class TestEnhancedFileDiscovery:
         assert str(tmp_path / "input.pdf") in files
         assert str(output_dir / "generated.pdf") not in files
 
+    def test_discover_files_skips_ignored_dirs(self, tmp_path):
+        """Test that default and caller-supplied ignored directories are not descended into."""
+        for dir_name in [".git", "node_modules", "vendor", "docs"]:
+            (tmp_path / dir_name).mkdir()
+            (tmp_path / dir_name / "file.pdf").write_text("content")
+
+        for parallel in (False, True):
+            files, _, _ = discover_files(str(tmp_path), parallel=parallel)
+            assert files == [
+                str(tmp_path / "docs" / "file.pdf"),
+                str(tmp_path / "vendor" / "file.pdf"),
+            ]
+
+            files, _, _ = discover_files(str(tmp_path), parallel=parallel, ignore_dirs={"vendor"})
+            assert [Path(f).parent.name for f in files] == [".git", "docs", "node_modules"]
+
     def test_discover_files_non_recursive(self, tmp_path):
         """Test non-recursive search when explicitly disabled."""
         # Create test directory structure
@@ -103,6 +152,44 @@ class TestEnhancedFileDiscovery:
         assert any("level1" in path and "l1.pdf" in path for path in rel_values)
         assert any("level3" in path and "deep.pdf" in path for path in rel_values)
 
+    def test_discover_files_parallel_matches_sequential(self, tmp_path):
+        """Test parallel recursive discovery returns the same files, order and relative paths."""
+        for rel_dir in ["a/b/c", "a.d", "b", "b/nested", config.DEFAULT_MARKDOWN_OUTPUT_DIR]:
+            (tmp_path / rel_dir).mkdir(parents=True, exist_ok=True)
+        for rel_file in [
+            "a.pdf",
+            "a/x.png",
+            "a/b/c/deep.txt",
+            "a.d/y.docx",
+            "b/z.md",
+            "b/nested/ignored.xyz",
+            f"{config.DEFAULT_MARKDOWN_OUTPUT_DIR}/generated.pdf",
+        ]:
+            (tmp_path / rel_file).write_text("content")
+
+        sequential = discover_files(str(tmp_path))
+        parallel = discover_files(str(tmp_path), parallel=True)
+
+        assert parallel == sequential
+        assert list(parallel[2].items()) == list(sequential[2].items())
+        assert len(parallel[0]) == 5
+
+    def test_discover_files_zero_inode_dir_entries(self, tmp_path):
+        """Test sibling directories are all visited when DirEntry.stat has no inode numbers."""
+        for name in ["a", "b", "c/d"]:
+            (tmp_path / name).mkdir(parents=True)
+            (tmp_path / name / "file.pdf").write_text("content")
+
+        scandir = _zero_inode_scandir(os.scandir)
+        for parallel in (False, True):
+            with patch("ocr_toolkit.utils.file_discovery.os.scandir", side_effect=scandir):
+                files, _, _ = discover_files(str(tmp_path), parallel=parallel)
+            assert files == [
+                str(tmp_path / "a" / "file.pdf"),
+                str(tmp_path / "b" / "file.pdf"),
+                str(tmp_path / "c" / "d" / "file.pdf"),
+            ]
+
     def test_discover_files_single_file(self, tmp_path):
         """Test file discovery for single file input."""
         test_file = tmp_path / "single.pdf"
@@ -115,6 +202,26 @@ class TestEnhancedFileDiscovery:
         assert base_dir == str(tmp_path)
         assert relative_paths[str(test_file)] == "single.pdf"
 
+    def test_discover_files_collects_file_stats(self, tmp_path):
+        """Test that file_stats receives the size of every discovered file in each mode."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "top.pdf").write_text("1234")
+        (tmp_path / "sub" / "nested.txt").write_text("12345678")
+        (tmp_path / "sub" / "ignored.xyz").write_text("x")
+
+        for kwargs in ({}, {"parallel": True}, {"recursive": False}):
+            file_stats = {}
+            files, _, _ = discover_files(str(tmp_path), file_stats=file_stats, **kwargs)
+
+            assert sorted(file_stats) == sorted(files)
+            assert {f: s.st_size for f, s in file_stats.items()} == {
+                f: Path(f).stat().st_size for f in files
+            }
+
+        file_stats = {}
+        files, _, _ = discover_files(str(tmp_path / "top.pdf"), file_stats=file_stats)
+        assert file_stats[files[0]].st_size == 4
+
     def test_get_output_file_path_preserve_structure(self, tmp_path):
         """Test output path generation with structure preservation."""
         input_path = str(tmp_path / "docs" / "section1" / "file.pdf")
@@ -132,6 +239,19 @@ class TestEnhancedFileDiscovery:
         ).replace("\\", "/")
         assert output_path_normalized == expected_path_normalized
 
+    def test_get_output_file_path_keeps_parent_segments(self, tmp_path):
+        """Test output paths drop "." and repeated separators but keep ".." segments."""
+        output_dir = f"{tmp_path}{os.sep}link{os.sep}..{os.sep}{os.sep}out{os.sep}."
+
+        output_path = get_output_file_path(
+            str(tmp_path / "a" / "file.pdf"),
+            output_dir,
+            preserve_structure=True,
+            relative_path="a/./file.pdf",
+        )
+
+        assert output_path == os.path.join(str(tmp_path), "link", "..", "out", "a", "file.md")
+
     def test_get_output_file_path_flat_structure(self, tmp_path):
         """Test output path generation with flat structure."""
         input_path = str(tmp_path / "docs" / "section1" / "file.pdf")
@@ -167,8 +287,6 @@ class TestEnhancedFileDiscovery:
         files, base_dir, relative_paths = discover_files(str(tmp_path))
 
         # Should find supported files - let's check what's actually supported
-        from ocr_toolkit.utils.file_discovery import get_supported_extensions
-
         supported_exts = get_supported_extensions()
 
         # Verify only supported files are found
@@ -181,20 +299,13 @@ class TestEnhancedFileDiscovery:
         # Should find at least pdf, jpg, docx if they are supported
         assert len(files) >= 3
 
-    def test_discover_files_real_nested_structure(self):
+    def test_discover_files_real_nested_structure(self, nested_test_structure, nested_discovery):
         """Test file discovery with real nested test structure."""
-        # Use the actual nested test structure created in testFile
-        test_path = Path(__file__).parent.parent.parent / "testFile" / "nested_test_structure"
-
-        # Skip test if nested structure doesn't exist
-        if not test_path.exists():
-            pytest.skip("Real nested test structure not available")
-
-        files, base_dir, relative_paths = discover_files(str(test_path))
+        files, base_dir, relative_paths = nested_discovery
 
         # Should find all 7 files in the nested structure
         assert len(files) == 7, f"Expected 7 files, found {len(files)}: {files}"
-        assert base_dir == str(test_path)
+        assert base_dir == str(nested_test_structure)
 
         # Verify expected files exist
         expected_filenames = {
@@ -228,14 +339,9 @@ class TestEnhancedFileDiscovery:
                     f"Relative path should preserve directory structure: {rel_path}"
                 )
 
-    def test_discover_files_real_nested_non_recursive(self):
+    def test_discover_files_real_nested_non_recursive(self, nested_discovery_nonrecursive):
         """Test non-recursive discovery with real nested structure."""
-        test_path = Path(__file__).parent.parent.parent / "testFile" / "nested_test_structure"
-
-        if not test_path.exists():
-            pytest.skip("Real nested test structure not available")
-
-        files, base_dir, relative_paths = discover_files(str(test_path), recursive=False)
+        files, base_dir, relative_paths = nested_discovery_nonrecursive
 
         # Should find no files at root level of nested structure
         assert len(files) == 0, (
@@ -245,13 +351,11 @@ class TestEnhancedFileDiscovery:
     def test_discover_files_boundary_conditions(self, tmp_path):
         """Test boundary conditions for file discovery."""
         # Test with very deep nesting (10 levels)
-        deep_path = tmp_path
-        for i in range(10):
-            deep_path = deep_path / f"level_{i}"
-        deep_path.mkdir(parents=True)
+        deep_path = os.path.join(tmp_path, *[f"level_{i}" for i in range(10)])
+        os.makedirs(deep_path)
 
         # Create file at deepest level
-        (deep_path / "deep_file.pdf").write_text("deep")
+        Path(deep_path, "deep_file.pdf").write_text("deep")
 
         files, base_dir, relative_paths = discover_files(str(tmp_path))
 
@@ -268,16 +372,14 @@ class TestEnhancedFileDiscovery:
     def test_discover_files_many_files_per_level(self, tmp_path):
         """Test discovery with multiple files at each directory level."""
         # Create structure with multiple files at each level
-        levels = [tmp_path]
+        level_dir = str(tmp_path)
         for i in range(5):
-            next_level = levels[-1] / f"level{i}"
-            next_level.mkdir()
+            level_dir = os.path.join(level_dir, f"level{i}")
+            os.mkdir(level_dir)
 
             # Create multiple files at each level
             for j in range(3):
-                (next_level / f"file_{i}_{j}.pdf").write_text(f"content_{i}_{j}")
-
-            levels.append(next_level)
+                Path(level_dir, f"file_{i}_{j}.pdf").write_text(f"content_{i}_{j}")
 
         files, base_dir, relative_paths = discover_files(str(tmp_path))
 
@@ -365,3 +467,60 @@ class TestEnhancedFileDiscovery:
 
         expected_flat_path = str(output_dir / "document.md")
         assert flat_output_path == expected_flat_path
+
+    def test_directory_cache_warm_path(self, tmp_path):
+        """Test a warm DirectoryCache skips os.makedirs for cached paths and their parents."""
+        cache = DirectoryCache()
+        output_dirs = [
+            str(tmp_path / "out" / "a" / "b"),
+            str(tmp_path / "out" / "a" / "c"),
+            str(tmp_path / "out" / "d"),
+        ]
+
+        for dir_path in output_dirs:
+            cache.ensure_directory(dir_path)
+        assert all(Path(d).is_dir() for d in output_dirs)
+
+        with patch("ocr_toolkit.utils.file_discovery.os.makedirs") as mock_makedirs:
+            for dir_path in output_dirs:
+                cache.ensure_directory(dir_path)
+            # Ancestors of created directories are cached as well
+            cache.ensure_directory(str(tmp_path / "out" / "a"))
+            cache.ensure_directory(str(tmp_path / "out"))
+
+        mock_makedirs.assert_not_called()
+
+    def test_filter_by_extension(self):
+        """Test extension filtering keeps order and matches Path.suffix semantics."""
+        files = [
+            "/docs/report.PDF",
+            "/docs/notes.txt",
+            "/docs/archive.tar.gz",
+            "/docs/.pdf",
+            "/docs.d/readme",
+            "/docs/scan.jpeg",
+        ]
+
+        assert filter_by_extension(files) == [
+            "/docs/report.PDF",
+            "/docs/notes.txt",
+            "/docs/scan.jpeg",
+        ]
+        assert filter_by_extension(files, {".pdf", ".jpeg"}) == [
+            "/docs/report.PDF",
+            "/docs/scan.jpeg",
+        ]
+        assert filter_by_extension([], {".pdf"}) == []
+
+    def test_directory_cache_ensure_directories(self, tmp_path):
+        """Test batch directory creation handles each unique path once, parents first."""
+        cache = DirectoryCache()
+        nested = str(tmp_path / "out" / "a" / "b")
+        sibling = str(tmp_path / "out" / "c")
+        parent = str(tmp_path / "out")
+
+        with patch.object(cache, "ensure_directory", wraps=cache.ensure_directory) as mock_ensure:
+            cache.ensure_directories([nested, sibling, nested, parent, sibling])
+
+        assert Path(nested).is_dir() and Path(sibling).is_dir()
+        assert [c.args[0] for c in mock_ensure.call_args_list] == [parent, sibling, nested]
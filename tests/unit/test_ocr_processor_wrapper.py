@@ -1,285 +1,160 @@
 """
 Unit tests for OCR processor wrapper module.
-"""
 
-import os
-import shutil
+The tests touch no files and only read shared module state, so they need no xdist
+group and can be spread across workers with ``pytest -n auto``.
+"""
 
-# Add project root to path
-import sys
-import tempfile
 from argparse import Namespace
 from unittest.mock import Mock, patch
 
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+import pytest
 
 from ocr_toolkit.ocr_processor_wrapper import OCRProcessorWrapper, create_ocr_processor_wrapper
+from ocr_toolkit.processors import OpenOCRDocHandler
+
+# Constructor kwargs with the (use_gpu, with_images) settings they should produce
+INIT_CASES = [
+    ({}, True, False),
+    ({"use_gpu": False}, False, False),
+    ({"with_images": True}, True, True),
+    ({"use_gpu": False, "with_images": True}, False, True),
+]
+
+# CLI args passed to process_document; the wrapper only reads them
+PAGES_ARGS = Namespace(pages="1")
+PROFILE_ARGS = Namespace(profile=True)
+
+# Input path for process_document; the mocked handler never opens it
+TEST_FILE = "test.txt"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_handler_class():
+    """Patch the OpenOCR handler once per module so no test loads the real model."""
+    # The wrapper resolves the handler through the ocr_toolkit.processors package
+    with patch("ocr_toolkit.processors.OpenOCRDocHandler", spec=True) as handler_class:
+        handler_class.return_value.is_available.return_value = True
+        yield handler_class
+
+
+def _mock_handler(**process_document):
+    """Build a fresh handler mock with process_document configured from the keyword args."""
+    handler = Mock(spec=OpenOCRDocHandler)
+    handler.process_document.configure_mock(**process_document)
+    return handler
+
+
+@pytest.fixture(scope="class")
+def processor(mock_handler_class):
+    """Share one untouched wrapper per class for tests that only read its state."""
+    return OCRProcessorWrapper()
 
 
 class TestOCRProcessorWrapper:
     """Test cases for OCRProcessorWrapper class."""
 
-    def setup_method(self):
-        """Setup test fixtures before each test method."""
-        # Temporary directories
-        self.test_dir = tempfile.mkdtemp()
-
-    def teardown_method(self):
-        """Cleanup after each test method."""
-        import pathlib
-
-        test_dir_path = pathlib.Path(self.test_dir)
-        if test_dir_path.exists():
-            shutil.rmtree(self.test_dir, ignore_errors=True)
-
-    def test_init_default_params(self):
-        """Test OCRProcessorWrapper initialization with default parameters."""
-        # Mock the OpenOCRDocHandler to avoid actual model loading
-        with patch(
-            "ocr_toolkit.processors.openocr_doc_handler.OpenOCRDocHandler"
-        ) as mock_handler_class:
-            mock_instance = Mock()
-            mock_instance.is_available.return_value = True
-            mock_handler_class.return_value = mock_instance
-
-            processor = OCRProcessorWrapper()
-
-            assert processor is not None
-            assert processor.use_gpu is True
-            assert processor.with_images is False
-
-    def test_init_with_cpu(self):
-        """Test OCRProcessorWrapper initialization with CPU mode."""
-        with patch(
-            "ocr_toolkit.processors.openocr_doc_handler.OpenOCRDocHandler"
-        ) as mock_handler_class:
-            mock_instance = Mock()
-            mock_instance.is_available.return_value = True
-            mock_handler_class.return_value = mock_instance
-
-            processor = OCRProcessorWrapper(use_gpu=False)
-
-            assert processor.use_gpu is False
-
-    def test_init_with_images(self):
-        """Test OCRProcessorWrapper initialization with image extraction."""
-        with patch(
-            "ocr_toolkit.processors.openocr_doc_handler.OpenOCRDocHandler"
-        ) as mock_handler_class:
-            mock_instance = Mock()
-            mock_instance.is_available.return_value = True
-            mock_handler_class.return_value = mock_instance
-
-            processor = OCRProcessorWrapper(with_images=True)
-
-            assert processor.with_images is True
-
-    def test_init_with_cpu_and_images(self):
-        """Test OCRProcessorWrapper initialization with CPU and image extraction."""
-        with patch(
-            "ocr_toolkit.processors.openocr_doc_handler.OpenOCRDocHandler"
-        ) as mock_handler_class:
-            mock_instance = Mock()
-            mock_instance.is_available.return_value = True
-            mock_handler_class.return_value = mock_instance
-
-            processor = OCRProcessorWrapper(use_gpu=False, with_images=True)
-
-            assert processor.use_gpu is False
-            assert processor.with_images is True
+    @pytest.mark.parametrize("kwargs, use_gpu, with_images", INIT_CASES)
+    def test_init_params(self, mock_handler_class, kwargs, use_gpu, with_images):
+        """Test OCRProcessorWrapper initialization with default, CPU and image options."""
+        processor = OCRProcessorWrapper(**kwargs)
+
+        assert processor.handler is mock_handler_class.return_value
+        assert processor.use_gpu is use_gpu
+        assert processor.with_images is with_images
 
     def test_process_document_success(self):
         """Test successful document processing."""
-        with patch(
-            "ocr_toolkit.processors.openocr_doc_handler.OpenOCRDocHandler"
-        ) as mock_handler_class:
-            # Setup mock handler
-            mock_instance = Mock()
-            mock_instance.is_available.return_value = True
-            mock_instance.process_document.return_value = (
-                "# Test Content\n\nThis is test content.",
-                {"page_count": 1},
-            )
-            mock_handler_class.return_value = mock_instance
-
-            processor = OCRProcessorWrapper()
-
-            # Create a test file
-            test_file = os.path.join(self.test_dir, "test.txt")
-            with open(test_file, "w") as f:
-                f.write("Test content")
-
-            # Mock the handler directly since _initialize_handler runs in __init__
-            processor.handler = mock_instance
-
-            result = processor.process_document(test_file)
-
-            assert result["success"] is True
-            assert result["file_path"] == test_file
-            assert result["chosen_method"] == "openocr_doc"
-            assert "Test Content" in result["final_content"]
-            assert result["processing_time"] >= 0
-            assert result["ocr_result"]["success"] is True
+        mock_instance = _mock_handler(
+            return_value=("# Test Content\n\nThis is test content.", {"page_count": 1})
+        )
+
+        processor = OCRProcessorWrapper()
+
+        # Mock the handler directly since _initialize_handler runs in __init__
+        processor.handler = mock_instance
+
+        result = processor.process_document(TEST_FILE)
+
+        assert result["success"] is True
+        assert result["file_path"] == TEST_FILE
+        assert result["chosen_method"] == "openocr_doc"
+        assert "Test Content" in result["final_content"]
+        assert result["processing_time"] >= 0
+        assert result["ocr_result"]["success"] is True
 
     def test_process_document_with_pages(self):
         """Test document processing with page selection."""
-        with patch(
-            "ocr_toolkit.processors.openocr_doc_handler.OpenOCRDocHandler"
-        ) as mock_handler_class:
-            # Setup mock handler
-            mock_instance = Mock()
-            mock_instance.is_available.return_value = True
-            mock_instance.process_document.return_value = (
-                "# Page 1\n\nContent",
-                {"page_count": 1, "selected_pages": [0]},
-            )
-            mock_handler_class.return_value = mock_instance
-
-            processor = OCRProcessorWrapper()
-
-            # Create a test file
-            test_file = os.path.join(self.test_dir, "test.txt")
-            with open(test_file, "w") as f:
-                f.write("Test content")
-
-            # Mock the handler directly
-            processor.handler = mock_instance
-
-            # Create args with pages parameter
-            args = Namespace(pages="1")
-            result = processor.process_document(test_file, args=args)
-
-            assert result["success"] is True
-            # Verify process_document was called with pages parameter
-            mock_instance.process_document.assert_called_once()
+        mock_instance = _mock_handler(
+            return_value=("# Page 1\n\nContent", {"page_count": 1, "selected_pages": [0]})
+        )
+
+        processor = OCRProcessorWrapper()
+
+        # Mock the handler directly
+        processor.handler = mock_instance
+
+        result = processor.process_document(TEST_FILE, args=PAGES_ARGS)
+
+        assert result["success"] is True
+        # Verify process_document was called with pages parameter
+        mock_instance.process_document.assert_called_once()
 
     def test_process_document_with_profile(self):
         """Test document processing with profiling enabled."""
-        with patch(
-            "ocr_toolkit.processors.openocr_doc_handler.OpenOCRDocHandler"
-        ) as mock_handler_class:
-            # Setup mock handler
-            mock_instance = Mock()
-            mock_instance.is_available.return_value = True
-            mock_instance.process_document.return_value = ("# Content\n\nTest", {"page_count": 1})
-            mock_handler_class.return_value = mock_instance
-
-            processor = OCRProcessorWrapper()
+        mock_instance = _mock_handler(return_value=("# Content\n\nTest", {"page_count": 1}))
 
-            # Create a test file
-            test_file = os.path.join(self.test_dir, "test.txt")
-            with open(test_file, "w") as f:
-                f.write("Test content")
+        processor = OCRProcessorWrapper()
 
-            # Mock the handler directly
-            processor.handler = mock_instance
+        # Mock the handler directly
+        processor.handler = mock_instance
 
-            # Create args with profile parameter
-            args = Namespace(profile=True)
-            result = processor.process_document(test_file, args=args)
+        result = processor.process_document(TEST_FILE, args=PROFILE_ARGS)
 
-            assert result["success"] is True
-            # Verify profiler was used
-            assert "metadata" in result["ocr_result"]
+        assert result["success"] is True
+        # Verify profiler was used
+        assert "metadata" in result["ocr_result"]
 
     def test_process_document_handler_not_available(self):
         """Test document processing when handler is not available."""
-        with patch(
-            "ocr_toolkit.processors.openocr_doc_handler.OpenOCRDocHandler"
-        ) as mock_handler_class:
-            # Setup mock handler to raise exception
-            mock_instance = Mock()
-            mock_instance.is_available.return_value = False
-            mock_instance.process_document.side_effect = RuntimeError("Handler not available")
-            mock_handler_class.return_value = mock_instance
-
-            processor = OCRProcessorWrapper()
+        # Setup mock handler to raise exception
+        mock_instance = _mock_handler(side_effect=RuntimeError("Handler not available"))
+        mock_instance.is_available.return_value = False
 
-            # Create a test file
-            test_file = os.path.join(self.test_dir, "test.txt")
-            with open(test_file, "w") as f:
-                f.write("Test content")
+        processor = OCRProcessorWrapper()
 
-            # Mock the handler directly
-            processor.handler = mock_instance
+        # Mock the handler directly
+        processor.handler = mock_instance
 
-            result = processor.process_document(test_file)
+        result = processor.process_document(TEST_FILE)
 
-            assert result["success"] is False
-            assert "Handler not available" in result["error"]
-            assert result["ocr_result"]["success"] is False
+        assert result["success"] is False
+        assert "Handler not available" in result["error"]
+        assert result["ocr_result"]["success"] is False
 
-    def test_get_statistics(self):
+    def test_get_statistics(self, processor):
         """Test getting basic statistics."""
-        with patch(
-            "ocr_toolkit.processors.openocr_doc_handler.OpenOCRDocHandler"
-        ) as mock_handler_class:
-            mock_instance = Mock()
-            mock_instance.is_available.return_value = True
-            mock_handler_class.return_value = mock_instance
+        stats = processor.get_statistics()
 
-            processor = OCRProcessorWrapper()
-            stats = processor.get_statistics()
+        assert "ocr_processed" in stats
+        assert "success_rate" in stats
+        assert stats["success_rate"] == 100.0
 
-            assert "ocr_processed" in stats
-            assert "success_rate" in stats
-            assert stats["success_rate"] == 100.0
-
-    def test_get_detailed_statistics(self):
+    def test_get_detailed_statistics(self, processor):
         """Test getting detailed statistics."""
-        with patch(
-            "ocr_toolkit.processors.openocr_doc_handler.OpenOCRDocHandler"
-        ) as mock_handler_class:
-            mock_instance = Mock()
-            mock_instance.is_available.return_value = True
-            mock_handler_class.return_value = mock_instance
-
-            processor = OCRProcessorWrapper()
-            stats = processor.get_detailed_statistics()
+        stats = processor.get_detailed_statistics()
 
-            assert "ocr_processed" in stats
-            assert "success_rate" in stats
+        assert "ocr_processed" in stats
+        assert "success_rate" in stats
 
 
 class TestCreateOCRProcessorWrapper:
     """Test cases for create_ocr_processor_wrapper function."""
 
-    def test_create_ocr_processor_wrapper_default(self):
-        """Test creating wrapper with default parameters."""
-        with patch(
-            "ocr_toolkit.processors.openocr_doc_handler.OpenOCRDocHandler"
-        ) as mock_handler_class:
-            mock_instance = Mock()
-            mock_instance.is_available.return_value = True
-            mock_handler_class.return_value = mock_instance
-
-            processor = create_ocr_processor_wrapper()
-
-            assert processor.use_gpu is True
-            assert processor.with_images is False
-
-    def test_create_ocr_processor_wrapper_with_cpu(self):
-        """Test creating wrapper with CPU mode."""
-        with patch(
-            "ocr_toolkit.processors.openocr_doc_handler.OpenOCRDocHandler"
-        ) as mock_handler_class:
-            mock_instance = Mock()
-            mock_instance.is_available.return_value = True
-            mock_handler_class.return_value = mock_instance
-
-            processor = create_ocr_processor_wrapper(use_gpu=False)
-
-            assert processor.use_gpu is False
-
-    def test_create_ocr_processor_wrapper_with_images(self):
-        """Test creating wrapper with image extraction."""
-        with patch(
-            "ocr_toolkit.processors.openocr_doc_handler.OpenOCRDocHandler"
-        ) as mock_handler_class:
-            mock_instance = Mock()
-            mock_instance.is_available.return_value = True
-            mock_handler_class.return_value = mock_instance
-
-            processor = create_ocr_processor_wrapper(with_images=True)
-
-            assert processor.with_images is True
+    @pytest.mark.parametrize("kwargs, use_gpu, with_images", INIT_CASES)
+    def test_create_ocr_processor_wrapper(self, kwargs, use_gpu, with_images):
+        """Test creating wrapper with default, CPU and image options."""
+        processor = create_ocr_processor_wrapper(**kwargs)
+
+        assert processor.use_gpu is use_gpu
+        assert processor.with_images is with_images
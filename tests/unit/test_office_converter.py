@@ -2,12 +2,8 @@
 Unit tests for OfficeConverter Linux compatibility behavior.
 """
 
-import os
-import sys
 from unittest.mock import Mock, patch
 
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
-
 from ocr_toolkit.converters import office_converter
 from ocr_toolkit.converters.strategies.libreoffice import LibreOfficeStrategy
 
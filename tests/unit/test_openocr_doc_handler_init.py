@@ -3,13 +3,11 @@ Unit tests for OpenOCRDocHandler initialization device selection.
 """
 
 import contextlib
-import os
 import sys
-from types import ModuleType
+from types import ModuleType, SimpleNamespace
 from unittest.mock import Mock, patch
 
-# Add project root to path
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+import pytest
 
 from ocr_toolkit.processors.openocr_doc_handler import OpenOCRDocHandler
 
@@ -22,65 +20,44 @@ def _mock_openocr_module(*, fail_gpu: bool = False):
         use_gpu = kwargs.get("use_gpu")
         if fail_gpu and use_gpu == "true":
             raise RuntimeError("gpu unavailable")
-        return Mock(name=f"pipeline_{use_gpu}")
+        return SimpleNamespace(use_gpu=use_gpu)
 
     openocr_ctor.side_effect = _create_pipeline
     openocr_mod.OpenOCR = openocr_ctor
     return openocr_mod, openocr_ctor
 
 
+@patch(
+    "ocr_toolkit.processors.openocr_doc_handler.suppress_external_library_output",
+    new=contextlib.nullcontext,
+)
+@patch("ocr_toolkit.processors.openocr_doc_handler.setup_nvidia_dll_paths", new=Mock())
 class TestOpenOCRDocHandlerInit:
     """Test device selection behavior during handler initialization."""
 
-    def test_default_uses_gpu(self):
-        """Default initialization should request GPU."""
+    @pytest.mark.parametrize(
+        "kwargs, use_gpu, device_flag",
+        [
+            ({}, True, "true"),
+            ({"use_gpu": False}, False, "false"),
+        ],
+    )
+    def test_requested_device(self, kwargs, use_gpu, device_flag):
+        """Default initialization should request GPU; use_gpu=False should request CPU."""
         openocr_mod, openocr_ctor = _mock_openocr_module()
-        with (
-            patch(
-                "ocr_toolkit.processors.openocr_doc_handler.suppress_external_library_output",
-                side_effect=lambda: contextlib.nullcontext(),
-            ),
-            patch("ocr_toolkit.processors.openocr_doc_handler.setup_nvidia_dll_paths"),
-            patch.dict(sys.modules, {"openocr": openocr_mod}),
-        ):
-            handler = OpenOCRDocHandler()
+        with patch.dict(sys.modules, {"openocr": openocr_mod}):
+            handler = OpenOCRDocHandler(**kwargs)
 
-        assert handler.use_gpu is True
+        assert handler.use_gpu is use_gpu
         assert openocr_ctor.call_count == 1
         assert openocr_ctor.call_args.kwargs["task"] == "doc"
-        assert openocr_ctor.call_args.kwargs["use_gpu"] == "true"
-        assert handler.is_available() is True
-
-    def test_use_gpu_false_forces_cpu(self):
-        """CPU mode should pass explicit CPU setting to OpenOCR."""
-        openocr_mod, openocr_ctor = _mock_openocr_module()
-        with (
-            patch(
-                "ocr_toolkit.processors.openocr_doc_handler.suppress_external_library_output",
-                side_effect=lambda: contextlib.nullcontext(),
-            ),
-            patch("ocr_toolkit.processors.openocr_doc_handler.setup_nvidia_dll_paths"),
-            patch.dict(sys.modules, {"openocr": openocr_mod}),
-        ):
-            handler = OpenOCRDocHandler(use_gpu=False)
-
-        assert handler.use_gpu is False
-        assert openocr_ctor.call_count == 1
-        assert openocr_ctor.call_args.kwargs["task"] == "doc"
-        assert openocr_ctor.call_args.kwargs["use_gpu"] == "false"
+        assert openocr_ctor.call_args.kwargs["use_gpu"] == device_flag
         assert handler.is_available() is True
 
     def test_gpu_failure_falls_back_to_cpu(self):
         """When GPU setup fails, handler should fall back to CPU."""
         openocr_mod, openocr_ctor = _mock_openocr_module(fail_gpu=True)
-        with (
-            patch(
-                "ocr_toolkit.processors.openocr_doc_handler.suppress_external_library_output",
-                side_effect=lambda: contextlib.nullcontext(),
-            ),
-            patch("ocr_toolkit.processors.openocr_doc_handler.setup_nvidia_dll_paths"),
-            patch.dict(sys.modules, {"openocr": openocr_mod}),
-        ):
+        with patch.dict(sys.modules, {"openocr": openocr_mod}):
             handler = OpenOCRDocHandler(use_gpu=True)
 
         assert handler.use_gpu is False
@@ -88,4 +65,3 @@ class TestOpenOCRDocHandlerInit:
         assert openocr_ctor.call_args_list[0].kwargs["use_gpu"] == "true"
         assert openocr_ctor.call_args_list[1].kwargs["use_gpu"] == "false"
         assert handler.is_available() is True
-
@@ -2,66 +2,53 @@
 Unit tests for processing statistics module.
 """
 
-import os
-import sys
+from collections import Counter
+from unittest.mock import patch
 
-# Add project root to path
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+import pytest
 
 from ocr_toolkit.processors.stats import ProcessingStats
 
 
+@pytest.fixture
+def stats():
+    """Provide a fresh ProcessingStats for each test, since the tests mutate it."""
+    return ProcessingStats()
+
+
 class TestProcessingStats:
     """Test cases for ProcessingStats class."""
 
-    def setup_method(self):
-        """Setup test fixtures before each test method."""
-        self.stats = ProcessingStats()
-
-    def test_init(self):
+    def test_init(self, stats):
         """Test ProcessingStats initialization."""
-        assert self.stats.total_processed == 0
-        assert self.stats.successful_processed == 0
-        assert self.stats.failed_processed == 0
-        assert self.stats.total_processing_time == 0.0
-        assert len(self.stats.method_stats) == 0
-
-    def test_add_result_ocr_success(self):
-        """Test adding successful OCR result."""
-        self.stats.add_result("ocr", True, 2.0, 3)  # 3 pages
-
-        assert self.stats.total_processed == 1
-        assert self.stats.successful_processed == 1
-        assert self.stats.failed_processed == 0
-        assert self.stats.total_processing_time == 2.0
-        assert self.stats.total_pages == 3
-        assert self.stats.method_stats["ocr"] == 1
-
-    def test_add_result_cnocr_success(self):
-        """Test adding successful CnOCR result."""
-        self.stats.add_result("cnocr", True, 1.5, 2)  # 2 pages
-
-        assert self.stats.total_processed == 1
-        assert self.stats.successful_processed == 1
-        assert self.stats.failed_processed == 0
-        assert self.stats.total_processing_time == 1.5
-        assert self.stats.total_pages == 2
-        assert self.stats.method_stats["cnocr"] == 1
-
-    def test_add_result_failure(self):
-        """Test adding failed result."""
-        self.stats.add_result("ocr", False, 0.5, 0)  # 0 pages for failed result
-
-        assert self.stats.total_processed == 1
-        assert self.stats.successful_processed == 0
-        assert self.stats.failed_processed == 1
-        assert self.stats.total_processing_time == 0.5
-        assert self.stats.total_pages == 0
-        assert self.stats.method_stats["ocr"] == 1
-
-    def test_get_summary_empty(self):
+        assert stats.total_processed == 0
+        assert stats.successful_processed == 0
+        assert stats.failed_processed == 0
+        assert stats.total_processing_time == 0.0
+        assert len(stats.method_stats) == 0
+
+    @pytest.mark.parametrize(
+        "method, success, processing_time, pages",
+        [
+            ("ocr", True, 2.0, 3),
+            ("cnocr", True, 1.5, 2),
+            ("ocr", False, 0.5, 0),  # 0 pages for failed result
+        ],
+    )
+    def test_add_result(self, stats, method, success, processing_time, pages):
+        """Test adding a single successful or failed result."""
+        stats.add_result(method, success, processing_time, pages)
+
+        assert stats.total_processed == 1
+        assert stats.successful_processed == int(success)
+        assert stats.failed_processed == int(not success)
+        assert stats.total_processing_time == processing_time
+        assert stats.total_pages == pages
+        assert stats.method_stats == Counter({method: 1})
+
+    def test_get_summary_empty(self, stats):
         """Test getting summary with no processing data."""
-        summary = self.stats.get_summary()
+        summary = stats.get_summary()
 
         assert summary["total_processed"] == 0
         assert summary["total_pages"] == 0
@@ -71,79 +58,130 @@ class TestProcessingStats:
         assert summary["total_processing_time"] == 0.0
         assert len(summary["method_stats"]) == 0
 
-    def test_get_summary_with_data(self):
+    def test_get_summary_with_data(self, stats):
         """Test getting summary with processing data."""
         # Add some results with page counts
-        self.stats.add_result("ocr", True, 1.0, 2)  # 2 pages
-        self.stats.add_result("cnocr", True, 2.0, 4)  # 4 pages
-        self.stats.add_result("ocr", True, 1.5, 3)  # 3 pages
-        self.stats.add_result("ocr", False, 0.5, 0)  # 0 pages (failed)
+        stats.add_result("ocr", True, 1.0, 2)  # 2 pages
+        stats.add_result("cnocr", True, 2.0, 4)  # 4 pages
+        stats.add_result("ocr", True, 1.5, 3)  # 3 pages
+        stats.add_result("ocr", False, 0.5, 0)  # 0 pages (failed)
 
-        summary = self.stats.get_summary()
+        summary = stats.get_summary()
 
         assert summary["total_processed"] == 4
         assert summary["total_pages"] == 9  # 2+4+3+0
         assert summary["successful_processed"] == 3
         assert summary["failed_processed"] == 1
-        assert summary["success_rate"] == 75.0  # 3/4 * 100
-        assert summary["average_time_per_file"] == 1.25  # 5.0/4
-        assert summary["average_time_per_page"] == 5.0 / 9  # 5.0/9 ≈ 0.556
-        assert summary["total_processing_time"] == 5.0
-        assert summary["method_stats"]["ocr"] == 3
-        assert summary["method_stats"]["cnocr"] == 1
-
-    def test_multiple_add_result_calls(self):
+        assert summary["success_rate"] == pytest.approx(75.0)  # 3/4 * 100
+        assert summary["average_time_per_file"] == pytest.approx(1.25)  # 5.0/4
+        assert summary["average_time_per_page"] == pytest.approx(5.0 / 9)  # ≈ 0.556
+        assert summary["total_processing_time"] == pytest.approx(5.0)
+        assert summary["method_stats"] == Counter({"ocr": 3, "cnocr": 1})
+
+    def test_get_summary_is_memoized(self, stats):
+        """Test that the summary is computed once until the statistics change."""
+        stats.add_result("ocr", True, 1.0, 2)
+        with patch.object(stats, "_build_summary", wraps=stats._build_summary) as build:
+            summary = stats.get_summary()
+            assert stats.get_summary() == summary
+            build.assert_called_once()
+
+            stats.add_result("ocr", False, 0.5, 0)
+            assert stats.get_summary()["total_processed"] == 2
+            assert build.call_count == 2
+
+        stats.reset()
+        assert stats.get_summary()["total_processed"] == 0
+
+    def test_get_summary_isolated_from_callers(self, stats):
+        """Test that callers can neither corrupt the cached summary nor bypass invalidation."""
+        stats.add_result("ocr", True, 1.0, 2)
+        summary = stats.get_summary()
+        summary["total_processed"] = 99
+        summary["method_stats"]["ocr"] = 99
+
+        fresh = stats.get_summary()
+        assert fresh["total_processed"] == 1
+        assert fresh["method_stats"] == Counter({"ocr": 1})
+
+        with pytest.raises(TypeError):
+            stats.method_stats["ocr"] += 1
+        assert stats.get_summary()["method_stats"] == Counter({"ocr": 1})
+
+    def test_multiple_add_result_calls(self, stats):
         """Test multiple sequential add_result calls."""
-        self.stats.add_result("ocr", True, 1.0, 2)
-        self.stats.add_result("cnocr", True, 2.0, 4)
-        self.stats.add_result("ocr", False, 0.5, 0)
-
-        assert self.stats.total_processed == 3
-        assert self.stats.successful_processed == 2
-        assert self.stats.failed_processed == 1
-        assert self.stats.total_processing_time == 3.5
-        assert self.stats.total_pages == 6  # 2+4+0
-        assert self.stats.method_stats["ocr"] == 2
-        assert self.stats.method_stats["cnocr"] == 1
-
-    def test_mixed_methods(self):
+        stats.add_result("ocr", True, 1.0, 2)
+        stats.add_result("cnocr", True, 2.0, 4)
+        stats.add_result("ocr", False, 0.5, 0)
+
+        assert stats.total_processed == 3
+        assert stats.successful_processed == 2
+        assert stats.failed_processed == 1
+        assert stats.total_processing_time == 3.5
+        assert stats.total_pages == 6  # 2+4+0
+        assert stats.method_stats == Counter({"ocr": 2, "cnocr": 1})
+
+    def test_add_results_batch_equivalence(self, stats):
+        """Test that add_results matches the same records added one at a time."""
+        methods = ("ocr", "cnocr", "custom_method")
+        records = [(methods[i % 3], i % 4 != 0, 0.1 * i, i % 5) for i in range(100)]
+
+        expected = ProcessingStats()
+        for record in records:
+            expected.add_result(*record)
+        stats.get_summary()  # the cached empty summary must be dropped
+        stats.add_results(iter(records))
+
+        assert stats == expected
+        assert stats.get_summary() == expected.get_summary()
+
+    def test_add_results_failure_leaves_stats_unchanged(self, stats):
+        """Test that a malformed record in a batch does not apply part of the batch."""
+        stats.add_result("ocr", True, 1.0, 2)
+        expected = ProcessingStats()
+        expected.add_result("ocr", True, 1.0, 2)
+
+        with pytest.raises(ValueError):
+            stats.add_results([("cnocr", True, 0.5, 1), ("ocr", False)])
+
+        assert stats == expected
+
+    def test_mixed_methods(self, stats):
         """Test mixing different processing methods."""
-        self.stats.add_result("ocr", True, 1.0, 1)
-        self.stats.add_result("cnocr", True, 2.0, 3)
-        self.stats.add_result("custom_method", True, 1.5, 2)
-
-        assert self.stats.total_processed == 3
-        assert self.stats.successful_processed == 3
-        assert self.stats.total_pages == 6  # 1+3+2
-        assert self.stats.method_stats["ocr"] == 1
-        assert self.stats.method_stats["cnocr"] == 1
-        assert self.stats.method_stats["custom_method"] == 1
-
-    def test_reset(self):
+        stats.add_result("ocr", True, 1.0, 1)
+        stats.add_result("cnocr", True, 2.0, 3)
+        stats.add_result("custom_method", True, 1.5, 2)
+
+        assert stats.total_processed == 3
+        assert stats.successful_processed == 3
+        assert stats.total_pages == 6  # 1+3+2
+        assert stats.method_stats == Counter({"ocr": 1, "cnocr": 1, "custom_method": 1})
+
+    def test_reset(self, stats):
         """Test resetting statistics."""
         # Add some data
-        self.stats.add_result("ocr", True, 1.0, 2)
-        self.stats.add_result("cnocr", True, 2.0, 3)
+        stats.add_result("ocr", True, 1.0, 2)
+        stats.add_result("cnocr", True, 2.0, 3)
 
         # Reset
-        self.stats.reset()
+        stats.reset()
 
-        assert self.stats.total_processed == 0
-        assert self.stats.successful_processed == 0
-        assert self.stats.failed_processed == 0
-        assert self.stats.total_processing_time == 0.0
-        assert self.stats.total_pages == 0
-        assert len(self.stats.method_stats) == 0
+        assert stats.total_processed == 0
+        assert stats.successful_processed == 0
+        assert stats.failed_processed == 0
+        assert stats.total_processing_time == 0.0
+        assert stats.total_pages == 0
+        assert len(stats.method_stats) == 0
 
-    def test_same_method_multiple_times(self):
+    def test_same_method_multiple_times(self, stats):
         """Test adding results for the same method multiple times."""
-        self.stats.add_result("ocr", True, 1.0, 2)
-        self.stats.add_result("ocr", False, 0.5, 0)
-        self.stats.add_result("ocr", True, 1.5, 3)
-
-        assert self.stats.total_processed == 3
-        assert self.stats.successful_processed == 2
-        assert self.stats.failed_processed == 1
-        assert self.stats.method_stats["ocr"] == 3
-        assert self.stats.total_processing_time == 3.0
-        assert self.stats.total_pages == 5  # 2+0+3
+        stats.add_result("ocr", True, 1.0, 2)
+        stats.add_result("ocr", False, 0.5, 0)
+        stats.add_result("ocr", True, 1.5, 3)
+
+        assert stats.total_processed == 3
+        assert stats.successful_processed == 2
+        assert stats.failed_processed == 1
+        assert stats.method_stats == Counter({"ocr": 3})
+        assert stats.total_processing_time == 3.0
+        assert stats.total_pages == 5  # 2+0+3
@@ -2,34 +2,127 @@
 Unit tests for quality evaluator module.
 """
 
-import os
-
-# Add project root to path
-import sys
+import re
 
 import pytest
 
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from ocr_toolkit.quality_evaluator import (
+    _WORD_RE,
+    QualityEvaluator,
+    _count_special_chars,
+    create_quality_evaluator,
+)
+
+# Sample text of each length used by the length-scaling test, built once at import
+LENGTH_CORPUS = {
+    n: ("This is a test sentence with good structure. " * (n // 45 + 1))[:n]
+    for n in (10, 100, 1000, 5000)
+}
+
+
+# Well-structured Markdown document with headers, paragraphs and lists
+NORMAL_MARKDOWN = """# Main Title
+        
+This is a well-formatted document with proper sentences. It contains multiple paragraphs and good structure.
+
+## Section 1
+
+- First bullet point
+- Second bullet point  
+- Third bullet point
+
+## Section 2
+
+1. First numbered item
+2. Second numbered item
+3. Third numbered item
+
+This document has good variety and structure."""
+
+# Short Markdown snippet covering every quality metric
+TITLE_MARKDOWN = (
+    "# Title\n\nThis is a test document with proper formatting.\n\n- List item 1\n- List item 2"
+)
 
-from ocr_toolkit.quality_evaluator import QualityEvaluator, create_quality_evaluator
+
+# compare_results cases: (md_result, ocr_result, file_path, chosen_method, selection_reason,
+# markitdown_available, ocr_available); None means the value is not checked
+COMPARE_CASES = [
+    pytest.param(
+        {
+            "success": True,
+            "content": "# Good Document\n\n"
+            "This is well-structured content with headers and proper formatting.",
+        },
+        {"success": True, "content": "Poor OCR result with bad formatting and errors."},
+        "test.docx",
+        None,
+        None,
+        True,
+        True,
+        id="both_successful",
+    ),
+    pytest.param(
+        {"success": True, "content": "Good content"},
+        {"success": False, "content": ""},
+        "test.pdf",
+        "markitdown",
+        "Only MarkItDown succeeded",
+        True,
+        False,
+        id="only_markitdown_succeeds",
+    ),
+    pytest.param(
+        {"success": False, "content": ""},
+        {"success": True, "content": "OCR content"},
+        "test.jpg",
+        "ocr",
+        "Only OCR succeeded",
+        False,
+        True,
+        id="only_ocr_succeeds",
+    ),
+    pytest.param(
+        {"success": False, "content": ""},
+        {"success": False, "content": ""},
+        "test.xyz",
+        None,
+        "Both methods failed",
+        False,
+        False,
+        id="both_failed",
+    ),
+    pytest.param(
+        {"success": True, "content": None},  # Missing content
+        {"success": True, "content": "Valid OCR content"},
+        "test.pdf",
+        "ocr",
+        "Only OCR succeeded",
+        False,
+        True,
+        id="missing_content",
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def evaluator():
+    """Share one QualityEvaluator across the module; its methods do not mutate it."""
+    return QualityEvaluator()
 
 
 class TestQualityEvaluator:
     """Test cases for QualityEvaluator class."""
 
-    def setup_method(self):
-        """Setup test fixtures before each test method."""
-        self.evaluator = QualityEvaluator()
-
-    def test_init(self):
+    def test_init(self, evaluator):
         """Test QualityEvaluator initialization."""
-        assert self.evaluator is not None
-        assert "markitdown_preference" in self.evaluator.weights
-        assert "ocr_preference" in self.evaluator.weights
+        assert evaluator is not None
+        assert "markitdown_preference" in evaluator.weights
+        assert "ocr_preference" in evaluator.weights
 
-    def test_calculate_text_quality_score_empty_text(self):
+    def test_calculate_text_quality_score_empty_text(self, evaluator):
         """Test quality score calculation for empty text."""
-        result = self.evaluator.calculate_text_quality_score("")
+        result = evaluator.calculate_text_quality_score("")
 
         assert result["total_score"] == 0
         assert result["length_score"] == 0
@@ -37,33 +130,15 @@ class TestQualityEvaluator:
         assert result["diversity_score"] == 0
         assert result["error_penalty"] == 1.0
 
-    def test_calculate_text_quality_score_whitespace_only(self):
+    def test_calculate_text_quality_score_whitespace_only(self, evaluator):
         """Test quality score calculation for whitespace-only text."""
-        result = self.evaluator.calculate_text_quality_score("   \n\t  ")
+        result = evaluator.calculate_text_quality_score("   \n\t  ")
 
         assert result["total_score"] == 0
 
-    def test_calculate_text_quality_score_normal_text(self):
+    def test_calculate_text_quality_score_normal_text(self, evaluator):
         """Test quality score calculation for normal text."""
-        text = """# Main Title
-        
-This is a well-formatted document with proper sentences. It contains multiple paragraphs and good structure.
-
-## Section 1
-
-- First bullet point
-- Second bullet point  
-- Third bullet point
-
-## Section 2
-
-1. First numbered item
-2. Second numbered item
-3. Third numbered item
-
-This document has good variety and structure."""
-
-        result = self.evaluator.calculate_text_quality_score(text)
+        result = evaluator.calculate_text_quality_score(NORMAL_MARKDOWN)
 
         assert isinstance(result, dict)
         assert "total_score" in result
@@ -73,35 +148,50 @@ This document has good variety and structure."""
         assert result["diversity_score"] > 0
         assert result["error_penalty"] > 0
 
-    def test_calculate_text_quality_score_poor_text(self):
+    def test_calculate_text_quality_score_poor_text(self, evaluator):
         """Test quality score calculation for poor quality text."""
         text = "th1s 1s p00r qu@l1ty t3xt w1th m@ny 3rr0rs!!!!!!"
-        result = self.evaluator.calculate_text_quality_score(text)
+        result = evaluator.calculate_text_quality_score(text)
 
         assert isinstance(result, dict)
         assert "total_score" in result
         assert result["error_penalty"] < 1.0  # Should have penalty for repetitive patterns
 
-    def test_calculate_text_quality_score_excessive_special_chars(self):
+    def test_calculate_text_quality_score_excessive_special_chars(self, evaluator):
         """Test penalty for excessive special characters."""
         text = "Normal text with @@@@@@@@@@@ way too many ######### special chars!!!"
-        result = self.evaluator.calculate_text_quality_score(text)
+        result = evaluator.calculate_text_quality_score(text)
 
         # Should have penalty for special characters
         assert result["error_penalty"] < 1.0
 
-    def test_calculate_text_quality_score_short_words(self):
+    def test_calculate_text_quality_score_short_words(self, evaluator):
         """Test penalty for too many single-character words."""
         text = "a b c d e f g h i j k l m n o p q r s t u v w x y z " * 10
-        result = self.evaluator.calculate_text_quality_score(text)
+        result = evaluator.calculate_text_quality_score(text)
 
         # Should have penalty for too many single-char words
         assert result["error_penalty"] < 1.0
 
-    def test_quality_metrics_components(self):
+    @pytest.mark.parametrize(
+        "text",
+        [
+            'Plain ASCII text, with (brackets) [and] {braces}: ok? yes! "quoted" - dash',
+            "Normal text with @@@@@@@@@@@ way too many ######### special chars!!!",
+            "th1s 1s p00r qu@l1ty t3xt w1th m@ny 3rr0rs!!!!!!",
+            "中文文本，包含全角标点。Mixed with ASCII & symbols ©®™ and émojis 🙂\u00a0\u2003",
+            "snake_case_word a b c 1 2 3 \t\r\n tabs\x0bvertical\x0cfeed \x1f\x7f",
+        ],
+    )
+    def test_text_scans_match_reference_regexes(self, text):
+        """Test the special-character and word scans against the original regexes."""
+        special = r'[^\w\s\n.,!?;:()\[\]{}""' "-]"
+        assert _count_special_chars(text) == len(re.findall(special, text))
+        assert _WORD_RE.findall(text) == re.findall(r"\b\w+\b", text)
+
+    def test_quality_metrics_components(self, evaluator):
         """Test individual quality metric components."""
-        text = "# Title\n\nThis is a test document with proper formatting.\n\n- List item 1\n- List item 2"
-        result = self.evaluator.calculate_text_quality_score(text)
+        result = evaluator.calculate_text_quality_score(TITLE_MARKDOWN)
 
         # Check that all expected metrics are present
         expected_metrics = [
@@ -116,103 +206,64 @@ This document has good variety and structure."""
             assert isinstance(result[metric], (int, float))
             assert result[metric] >= 0
 
-    @pytest.mark.parametrize("text_length", [10, 100, 1000, 5000])
-    def test_quality_score_different_lengths(self, text_length):
+    @pytest.mark.parametrize("text_length", list(LENGTH_CORPUS))
+    def test_quality_score_different_lengths(self, evaluator, text_length):
         """Test quality score calculation for different text lengths."""
-        text = "This is a test sentence with good structure. " * (text_length // 45 + 1)
-        text = text[:text_length]
-
-        result = self.evaluator.calculate_text_quality_score(text)
+        result = evaluator.calculate_text_quality_score(LENGTH_CORPUS[text_length])
         assert isinstance(result["total_score"], (int, float))
         assert result["total_score"] >= 0
 
-    def test_get_file_type_preference_docx(self):
+    def test_get_file_type_preference_docx(self, evaluator):
         """Test file type preference for DOCX files."""
-        result = self.evaluator.get_file_type_preference("test.docx")
+        result = evaluator.get_file_type_preference("test.docx")
 
         assert "markitdown_preference" in result
         assert "ocr_preference" in result
         assert result["markitdown_preference"] > 1.0  # DOCX should prefer MarkItDown
 
-    def test_get_file_type_preference_jpg(self):
+    def test_get_file_type_preference_jpg(self, evaluator):
         """Test file type preference for image files."""
-        result = self.evaluator.get_file_type_preference("test.jpg")
+        result = evaluator.get_file_type_preference("test.jpg")
 
         assert result["ocr_preference"] > 1.0  # Images should prefer OCR
 
-    def test_get_file_type_preference_unknown(self):
+    def test_get_file_type_preference_unknown(self, evaluator):
         """Test file type preference for unknown formats."""
-        result = self.evaluator.get_file_type_preference("test.unknown")
+        result = evaluator.get_file_type_preference("test.unknown")
 
         assert result["markitdown_preference"] == 1.0  # Default preference
         assert result["ocr_preference"] == 1.0
 
-    def test_compare_results_both_successful(self):
-        """Test comparison when both methods succeed."""
-        md_result = {
-            "success": True,
-            "content": "# Good Document\n\nThis is well-structured content with headers and proper formatting.",
-        }
-
-        ocr_result = {"success": True, "content": "Poor OCR result with bad formatting and errors."}
-
-        file_path = "test.docx"
-
-        result = self.evaluator.compare_results(md_result, ocr_result, file_path)
+    @pytest.mark.parametrize(
+        "md_result, ocr_result, file_path, chosen, reason, md_available, ocr_available",
+        COMPARE_CASES,
+    )
+    def test_compare_results(
+        self,
+        evaluator,
+        md_result,
+        ocr_result,
+        file_path,
+        chosen,
+        reason,
+        md_available,
+        ocr_available,
+    ):
+        """Test method selection for each combination of MarkItDown and OCR outcomes."""
+        result = evaluator.compare_results(md_result, ocr_result, file_path)
 
         assert "chosen_method" in result
         assert "markitdown_score" in result
         assert "ocr_score" in result
-        assert result["markitdown_available"] == True
-        assert result["ocr_available"] == True
         assert "selection_reason" in result
-
-    def test_compare_results_only_markitdown_succeeds(self):
-        """Test comparison when only MarkItDown succeeds."""
-        md_result = {"success": True, "content": "Good content"}
-        ocr_result = {"success": False, "content": ""}
-
-        result = self.evaluator.compare_results(md_result, ocr_result, "test.pdf")
-
-        assert result["chosen_method"] == "markitdown"
-        assert result["selection_reason"] == "Only MarkItDown succeeded"
-        assert result["markitdown_available"] == True
-        assert result["ocr_available"] == False
-
-    def test_compare_results_only_ocr_succeeds(self):
-        """Test comparison when only OCR succeeds."""
-        md_result = {"success": False, "content": ""}
-        ocr_result = {"success": True, "content": "OCR content"}
-
-        result = self.evaluator.compare_results(md_result, ocr_result, "test.jpg")
-
-        assert result["chosen_method"] == "ocr"
-        assert result["selection_reason"] == "Only OCR succeeded"
-        assert result["markitdown_available"] == False
-        assert result["ocr_available"] == True
-
-    def test_compare_results_both_failed(self):
-        """Test comparison when both methods fail."""
-        md_result = {"success": False, "content": ""}
-        ocr_result = {"success": False, "content": ""}
-
-        result = self.evaluator.compare_results(md_result, ocr_result, "test.xyz")
-
-        assert result["selection_reason"] == "Both methods failed"
-        assert result["markitdown_available"] == False
-        assert result["ocr_available"] == False
-
-    def test_compare_results_missing_content(self):
-        """Test comparison with missing content in successful results."""
-        md_result = {"success": True, "content": None}  # Missing content
-        ocr_result = {"success": True, "content": "Valid OCR content"}
-
-        result = self.evaluator.compare_results(md_result, ocr_result, "test.pdf")
-
-        assert result["chosen_method"] == "ocr"
-        assert result["selection_reason"] == "Only OCR succeeded"
-
-    def test_format_comparison_summary(self):
+        if chosen is not None:
+            assert result["chosen_method"] == chosen
+        if reason is not None:
+            assert result["selection_reason"] == reason
+        assert result["markitdown_available"] is md_available
+        assert result["ocr_available"] is ocr_available
+
+    def test_format_comparison_summary(self, evaluator):
         """Test formatting of comparison summary."""
         comparison = {
             "file_path": "/path/to/test_document.pdf",
@@ -224,7 +275,7 @@ This document has good variety and structure."""
             "ocr_score": 72.3,
         }
 
-        summary = self.evaluator.format_comparison_summary(comparison)
+        summary = evaluator.format_comparison_summary(comparison)
 
         assert "test_document.pdf" in summary
         assert "MARKITDOWN" in summary
@@ -232,7 +283,7 @@ This document has good variety and structure."""
         assert "85.5" in summary
         assert "72.3" in summary
 
-    def test_format_comparison_summary_single_method(self):
+    def test_format_comparison_summary_single_method(self, evaluator):
         """Test formatting summary when only one method available."""
         comparison = {
             "file_path": "/path/to/image.jpg",
@@ -242,7 +293,7 @@ This document has good variety and structure."""
             "ocr_available": True,
         }
 
-        summary = self.evaluator.format_comparison_summary(comparison)
+        summary = evaluator.format_comparison_summary(comparison)
 
         assert "image.jpg" in summary
         assert "OCR" in summary